@@ -1,7 +1,4 @@
-from .main_controller import MainController
-from .player_controller import PlayerController
-from .tournament_controller import TournamentController
-from .statistic_controller import StatisticsController
+from importlib import import_module
 
 __all__ = [
     "MainController",
@@ -9,3 +6,18 @@ __all__ = [
     "TournamentController",
     "StatisticsController",
 ]
+
+_SUBMODULES = {
+    "MainController": ".main_controller",
+    "PlayerController": ".player_controller",
+    "TournamentController": ".tournament_controller",
+    "StatisticsController": ".statistic_controller",
+}
+
+
+def __getattr__(name):
+    if name not in _SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_SUBMODULES[name], __name__), name)
+    globals()[name] = value
+    return value
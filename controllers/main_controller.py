@@ -1,3 +1,5 @@
+from typing import Tuple
+
 from views.menu_view import MenuView
 from controllers.player_controller import PlayerController
 from controllers.tournament_controller import TournamentController
@@ -7,6 +9,7 @@ from data.data_manager import DataManager
 
 class MainController:
     def __init__(self):
+        self._last_players_version = -1
         self._init_data_layer()
         self._init_controllers()
         self._init_views()
@@ -20,7 +23,7 @@ class MainController:
             self.data_manager, self.players
         )
         self.tournament_controller = TournamentController(
-            self.data_manager, self.players
+            self.data_manager, self.players, self.player_controller
         )
         self.statistics_controller = StatisticsController(
             self.player_controller,
@@ -33,19 +36,24 @@ class MainController:
     def run(self):
         print("Application démarrée avec succès!")
         try:
+            needs_redraw = True
             while True:
                 self._sync_data()
-                self.menu_view.display_main_menu()
+                if needs_redraw:
+                    self.menu_view.display_main_menu()
                 choice = self.menu_view.get_user_choice("Votre choix")
 
-                if not self._handle_main_menu_choice(choice):
+                keep_running, needs_redraw = self._handle_main_menu_choice(
+                    choice
+                )
+                if not keep_running:
                     break
         except Exception as e:
             self.menu_view.display_error(
                 f"Erreur dans l'application: {e}"
             )
 
-    def _handle_main_menu_choice(self, choice: str) -> bool:
+    def _handle_main_menu_choice(self, choice: str) -> Tuple[bool, bool]:
         try:
             if choice == "1":
                 self.player_controller.run()
@@ -54,17 +62,18 @@ class MainController:
             elif choice == "3":
                 self.statistics_controller.run()
             elif choice == "0":
-                return self._handle_quit()
+                return self._handle_quit(), False
             else:
                 self.menu_view.display_error(
                     "Choix invalide. Veuillez entrer 0, 1, 2 ou 3."
                 )
+                return True, False
         except Exception as e:
             self.menu_view.display_error(
                 f"Erreur lors du traitement: {e}"
             )
 
-        return True
+        return True, True
 
     def _handle_quit(self) -> bool:
         if self.menu_view.confirm_action(
@@ -78,13 +87,20 @@ class MainController:
         return True
 
     def _sync_data(self):
-        self.players = self.player_controller.get_all_players()
-        self.tournament_controller.update_players_data(self.players)
+        version = self.player_controller.get_players_version()
+        if version == self._last_players_version:
+            return
+        self.players = self.player_controller.get_all_players_ref()
+        self.tournament_controller.update_players_data(
+            self.players, self.player_controller.pop_changed_player_ids()
+        )
+        self._last_players_version = version
 
     def _save_all_data(self):
         try:
             self.player_controller.save_data()
             self.tournament_controller.save_data()
+            self.data_manager.flush()
         except Exception as e:
             self.menu_view.display_error(
                 f"Erreur lors de la sauvegarde: {e}"
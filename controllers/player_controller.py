@@ -1,4 +1,9 @@
-from typing import List, Dict
+import atexit
+from bisect import bisect_left, bisect_right
+from concurrent.futures import Future
+from contextlib import contextmanager
+from operator import attrgetter
+from typing import List, Dict, Optional, Set, Tuple
 from models.player import Player
 from views.player_view import PlayerView
 from data.data_manager import DataManager
@@ -8,17 +13,52 @@ from utils.validators import (
     validate_date_format
 )
 
+AUTO_FLUSH_EVERY = 50
+
+_SORT_KEY = attrgetter('_sort_key')
+
+_PLAYER_FIELDS = ('last_name', 'first_name', 'birthdate', 'national_id')
+_PLAYER_STATE = attrgetter(*_PLAYER_FIELDS)
+
+# Cheapest checks first, the date parse last
+_PLAYER_FIELD_CHECKS = (
+    ('national_id', validate_chess_id,
+     "Identifiant national invalide (format: AB12345)."),
+    ('last_name', validate_name, "Nom de famille invalide."),
+    ('first_name', validate_name, "Prénom invalide."),
+    ('birthdate', validate_date_format,
+     "Date de naissance invalide (format: YYYY-MM-DD)."),
+)
+
 
 class PlayerController:
 
     def __init__(self, data_manager: DataManager, players: List[Player]):
         self.data_manager = data_manager
         self.players = players
+        self._by_id: Dict[str, Player] = {
+            p.national_id: p for p in self.players
+        }
         self.player_view = PlayerView()
+        self._version = 0
+        self._dirty = False
+        self._pending_changes = 0
+        self._pending_save: Optional[Tuple[Future, int]] = None
+        self._changed_ids: Set[str] = set()
+        self._sorted_players: Optional[List[Player]] = None
+        self._sorted_keys: List[tuple] = []
+        self._menu_handlers = {
+            "1": self._handle_add_player,
+            "2": self._handle_list_all_players,
+            "3": self._handle_modify_player,
+            "4": self._handle_delete_player,
+        }
+        atexit.register(self.save_data)
 
     def run(self):
         try:
             while True:
+                self._report_failed_save()
                 self.player_view.display_player_menu()
                 choice = self.player_view.get_user_choice("Votre choix")
                 if not self._handle_player_menu_choice(choice):
@@ -27,19 +67,15 @@ class PlayerController:
             self.player_view.display_error(
                 f"Erreur dans le gestionnaire de joueurs: {e}"
             )
+        self.save_data()
 
     def _handle_player_menu_choice(self, choice: str) -> bool:
+        if choice == "0":
+            return False
         try:
-            if choice == "1":
-                self._handle_add_player()
-            elif choice == "2":
-                self._handle_list_all_players()
-            elif choice == "3":
-                self._handle_modify_player()
-            elif choice == "4":
-                self._handle_delete_player()
-            elif choice == "0":
-                return False
+            handler = self._menu_handlers.get(choice)
+            if handler:
+                handler()
             else:
                 self.player_view.display_error(
                     "Choix invalide. Entrez un nombre entre 0 et 4."
@@ -48,16 +84,16 @@ class PlayerController:
             self.player_view.display_error(f"Erreur lors du traitement: {e}")
         return True
 
-    def _handle_add_player(self):
+    def _handle_add_player(self) -> Optional[Player]:
         try:
             player_data = self.player_view.get_player_info()
-            if not self._validate_player_data(player_data):
-                return
             if self._player_exists(player_data['national_id']):
                 self.player_view.display_error(
                     f"Un joueur avec l'ID {player_data['national_id']} existe déjà."
                 )
-                return
+                return None
+            if not self._validate_player_data(player_data):
+                return None
 
             player = Player(
                 last_name=player_data['last_name'],
@@ -65,30 +101,32 @@ class PlayerController:
                 birthdate=player_data['birthdate'],
                 national_id=player_data['national_id']
             )
+            if not self.data_manager.save_player(player, "add"):
+                self.player_view.display_error(
+                    "Erreur lors de la sauvegarde des joueurs."
+                )
+                return None
             self.players.append(player)
+            self._by_id[player.national_id] = player
+            self._insert_sorted(player)
+            self._mark_dirty()
 
-            if self._save_players():
-                self.player_view.display_success(
-                    f"Joueur {player.first_name} {player.last_name} ajouté avec succès!"
-                )
-                self.player_view.display_player_details(player)
-            else:
-                self.players.remove(player)
-                self.player_view.display_error("Erreur lors de la sauvegarde.")
+            self.player_view.display_success(
+                f"Joueur {player.first_name} {player.last_name} ajouté avec succès!"
+            )
+            self.player_view.display_player_details(player)
+            return player
         except ValueError as e:
             self.player_view.display_error(f"Données invalides: {e}")
         except Exception as e:
             self.player_view.display_error(f"Erreur lors de l'ajout: {e}")
+        return None
 
     def _handle_list_all_players(self):
         if not self.players:
             self.player_view.display_info("Aucun joueur enregistré.")
             return
-        sorted_players = sorted(
-            self.players,
-            key=lambda p: (p.last_name.lower(), p.first_name.lower())
-        )
-        self.player_view.display_players_list(sorted_players)
+        self.player_view.display_players_list(self.get_sorted_players())
         self.player_view.wait_for_user()
 
     def _handle_modify_player(self):
@@ -107,99 +145,165 @@ class PlayerController:
         if not self._validate_player_data(new_data):
             return
 
-        if (new_data['national_id'] != player.national_id and
-                self._player_exists(new_data['national_id'])):
+        new_id = Player.normalize_id(new_data['national_id'])
+        if new_id != player.national_id and self._player_exists(new_id):
             self.player_view.display_error(
                 f"L'ID {new_data['national_id']} est déjà utilisé."
             )
             return
 
-        old = {
-            'last_name': player.last_name,
-            'first_name': player.first_name,
-            'birthdate': player.birthdate,
-            'national_id': player.national_id
-        }
+        previous_id = player.national_id
         try:
-            player.last_name = new_data['last_name']
-            player.first_name = new_data['first_name']
-            player.birthdate = new_data['birthdate']
-            player.national_id = new_data['national_id']
-
-            if self._save_players():
-                self.player_view.display_success("Joueur modifié avec succès!")
-                self.player_view.display_player_details(player)
-            else:
-                player.last_name = old['last_name']
-                player.first_name = old['first_name']
-                player.birthdate = old['birthdate']
-                player.national_id = old['national_id']
-                self.player_view.display_error("Erreur lors de la sauvegarde.")
+            with self._player_snapshot(player):
+                self._apply_player_data(player, new_data)
+                if not self.data_manager.save_player(
+                    player, "update", previous_id
+                ):
+                    raise IOError("journal des joueurs non enregistré")
         except Exception as e:
-            player.last_name = old['last_name']
-            player.first_name = old['first_name']
-            player.birthdate = old['birthdate']
-            player.national_id = old['national_id']
             self.player_view.display_error(f"Erreur lors de la modification: {e}")
+            return
+
+        self._mark_dirty(previous_id, player.national_id)
+        self.player_view.display_success("Joueur modifié avec succès!")
+        self.player_view.display_player_details(player)
+
+    @contextmanager
+    def _player_snapshot(self, player: Player):
+        saved = _PLAYER_STATE(player)
+        try:
+            yield
+        except Exception:
+            self._apply_player_data(player, dict(zip(_PLAYER_FIELDS, saved)))
+            raise
+
+    def _apply_player_data(self, player: Player, data: Dict[str, str]):
+        previous_id = player.national_id
+        for field in _PLAYER_FIELDS:
+            setattr(player, field, data[field])
+        player.national_id = Player.normalize_id(player.national_id)
+        self._sorted_players = None
+        self._reindex_player(player, previous_id)
 
     def _handle_delete_player(self):
         if not self.players:
             self.player_view.display_info("Aucun joueur à supprimer.")
             return
 
-        player = self.player_view.select_player_from_list(
+        index = self.player_view.select_player_index_from_list(
             self.players,
             "SÉLECTIONNER LE JOUEUR À SUPPRIMER"
         )
-        if not player:
+        if index is None:
             return
+        player = self.players[index]
 
         if not self.player_view.confirm_player_deletion(player):
             self.player_view.display_info("Suppression annulée.")
             return
 
         try:
-            self.players.remove(player)
-            if self._save_players():
-                self.player_view.display_success(
-                    f"Joueur {player.first_name} {player.last_name} supprimé avec succès!"
+            if not self.data_manager.save_player(player, "delete"):
+                self.player_view.display_error(
+                    "Erreur lors de la sauvegarde des joueurs."
                 )
-            else:
-                self.players.append(player)
-                self.player_view.display_error("Erreur lors de la sauvegarde.")
+                return
+            self.players.pop(index)
+            self._by_id.pop(player.national_id, None)
+            self._remove_sorted(player)
+            self._mark_dirty(player.national_id)
+            self.player_view.display_success(
+                f"Joueur {player.first_name} {player.last_name} supprimé avec succès!"
+            )
         except Exception as e:
             self.player_view.display_error(f"Erreur lors de la suppression: {e}")
 
     def _validate_player_data(self, player_data: Dict[str, str]) -> bool:
-        if not validate_name(player_data['last_name']):
-            self.player_view.display_error("Nom de famille invalide.")
-            return False
-        if not validate_name(player_data['first_name']):
-            self.player_view.display_error("Prénom invalide.")
-            return False
-        if not validate_date_format(player_data['birthdate']):
-            self.player_view.display_error(
-                "Date de naissance invalide (format: YYYY-MM-DD)."
-            )
-            return False
-        if not validate_chess_id(player_data['national_id']):
-            self.player_view.display_error(
-                "Identifiant national invalide (format: AB12345)."
-            )
-            return False
+        for field, validator, message in _PLAYER_FIELD_CHECKS:
+            if not validator(player_data[field]):
+                self.player_view.display_error(message)
+                return False
         return True
 
     def _player_exists(self, national_id: str) -> bool:
-        return any(p.national_id == national_id for p in self.players)
+        return Player.normalize_id(national_id) in self._by_id
+
+    def _reindex_player(self, player: Player, previous_id: str):
+        if previous_id != player.national_id:
+            self._by_id.pop(previous_id, None)
+        self._by_id[player.national_id] = player
+
+    def _mark_dirty(self, *national_ids: str):
+        self._changed_ids.update(national_ids)
+        self._dirty = True
+        self._version += 1
+        self._pending_changes += 1
+        if self._pending_changes >= AUTO_FLUSH_EVERY:
+            self._flush_players()
 
-    def _save_players(self) -> bool:
+    def _save_players(self) -> Future:
         return self.data_manager.save_players(self.players)
 
-    def get_all_players(self) -> List[Player]:
-        return self.players.copy()
+    def _flush_players(self):
+        self._report_failed_save()
+        if not self._dirty:
+            return
+        if self._pending_save and self._pending_save[1] == self._version:
+            return
+        self._pending_save = (self._save_players(), self._version)
+        self._pending_changes = 0
 
-    def save_data(self):
-        if not self._save_players():
+    def _report_failed_save(self):
+        # The write finishes on the writer thread, the roster stays dirty
+        # until a save of its latest version succeeds
+        if not self._pending_save or not self._pending_save[0].done():
+            return
+        future, version = self._pending_save
+        self._pending_save = None
+        if not future.result():
             self.player_view.display_error(
                 "Erreur lors de la sauvegarde des joueurs."
             )
+        elif version == self._version:
+            self._dirty = False
+
+    def get_all_players(self) -> List[Player]:
+        return self.players.copy()
+
+    def get_all_players_ref(self) -> List[Player]:
+        return self.players
+
+    def get_sorted_players(self) -> List[Player]:
+        if self._sorted_players is None:
+            self._sorted_players = sorted(self.players, key=_SORT_KEY)
+            self._sorted_keys = [p._sort_key for p in self._sorted_players]
+        return self._sorted_players
+
+    def _insert_sorted(self, player: Player):
+        if self._sorted_players is None:
+            return
+        index = bisect_right(self._sorted_keys, player._sort_key)
+        self._sorted_keys.insert(index, player._sort_key)
+        self._sorted_players.insert(index, player)
+
+    def _remove_sorted(self, player: Player):
+        if self._sorted_players is None:
+            return
+        index = bisect_left(self._sorted_keys, player._sort_key)
+        while self._sorted_players[index] is not player:
+            index += 1
+        del self._sorted_keys[index]
+        del self._sorted_players[index]
+
+    def get_players_version(self) -> int:
+        return self._version
+
+    def pop_changed_player_ids(self) -> Set[str]:
+        changed_ids, self._changed_ids = self._changed_ids, set()
+        return changed_ids
+
+    def save_data(self):
+        self._flush_players()
+        if self._pending_save:
+            self._pending_save[0].result()
+            self._report_failed_save()
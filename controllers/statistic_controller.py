@@ -1,3 +1,7 @@
+from operator import attrgetter
+from typing import List, Optional
+
+from models.tournament import Tournament
 from controllers.player_controller import PlayerController
 from controllers.tournament_controller import TournamentController
 from views.statistic_view import StatisticsView
@@ -10,8 +14,19 @@ class StatisticsController:
         self.player_controller = player_controller
         self.tournament_controller = tournament_controller
         self.statistics_view = StatisticsView()
+        self._tournaments: Optional[List[Tournament]] = None
+        self._menu_handlers = {
+            "1": self._show_all_players_alphabetical,
+            "2": self._show_all_tournaments,
+            "3": self._show_tournament_details,
+            "4": self._show_tournament_players,
+            "5": self._show_tournament_rounds_and_matches,
+            "6": self._show_simple_global_stats,
+        }
 
     def run(self):
+        # Nothing is modified from this menu, one snapshot per session is enough
+        self._tournaments = None
         try:
             while True:
                 self.statistics_view.display_simple_statistics_menu()
@@ -26,21 +41,13 @@ class StatisticsController:
             )
 
     def _handle_statistics_menu_choice(self, choice: str) -> bool:
+        if choice == "0":
+            return False
+
         try:
-            if choice == "1":
-                self._show_all_players_alphabetical()
-            elif choice == "2":
-                self._show_all_tournaments()
-            elif choice == "3":
-                self._show_tournament_details()
-            elif choice == "4":
-                self._show_tournament_players()
-            elif choice == "5":
-                self._show_tournament_rounds_and_matches()
-            elif choice == "6":
-                self._show_simple_global_stats()
-            elif choice == "0":
-                return False
+            handler = self._menu_handlers.get(choice)
+            if handler:
+                handler()
             else:
                 self.statistics_view.display_error(
                     "Choix invalide. Entrez 0, 1, 2, 3, 4, 5 ou 6."
@@ -53,22 +60,23 @@ class StatisticsController:
 
         return True
 
+    def _get_tournaments(self) -> List[Tournament]:
+        if self._tournaments is None:
+            self._tournaments = self.tournament_controller.get_all_tournaments()
+        return self._tournaments
+
     def _show_all_players_alphabetical(self):
-        players = self.player_controller.get_all_players()
+        sorted_players = self.player_controller.get_sorted_players()
 
-        if not players:
+        if not sorted_players:
             self.statistics_view.display_info("Aucun joueur enregistré.")
             return
 
-        sorted_players = sorted(
-            players,
-            key=lambda p: (p.last_name.lower(), p.first_name.lower())
-        )
         self.statistics_view.display_players_alphabetical_list(sorted_players)
         self.statistics_view.wait_for_user()
 
     def _show_all_tournaments(self):
-        tournaments = self.tournament_controller.get_all_tournaments()
+        tournaments = self._get_tournaments()
 
         if not tournaments:
             self.statistics_view.display_info("Aucun tournoi créé.")
@@ -78,7 +86,7 @@ class StatisticsController:
         self.statistics_view.wait_for_user()
 
     def _show_tournament_details(self):
-        tournaments = self.tournament_controller.get_all_tournaments()
+        tournaments = self._get_tournaments()
 
         if not tournaments:
             self.statistics_view.display_info("Aucun tournoi créé.")
@@ -94,7 +102,7 @@ class StatisticsController:
         self.statistics_view.wait_for_user()
 
     def _show_tournament_players(self):
-        tournaments = self.tournament_controller.get_all_tournaments()
+        tournaments = self._get_tournaments()
 
         if not tournaments:
             self.statistics_view.display_info("Aucun tournoi créé.")
@@ -113,8 +121,7 @@ class StatisticsController:
             return
 
         sorted_players = sorted(
-            tournament.players,
-            key=lambda p: (p.last_name.lower(), p.first_name.lower())
+            tournament.players, key=attrgetter('_sort_key')
         )
         self.statistics_view.display_tournament_players_report(
             tournament, sorted_players
@@ -122,7 +129,7 @@ class StatisticsController:
         self.statistics_view.wait_for_user()
 
     def _show_tournament_rounds_and_matches(self):
-        tournaments = self.tournament_controller.get_all_tournaments()
+        tournaments = self._get_tournaments()
 
         if not tournaments:
             self.statistics_view.display_info("Aucun tournoi créé.")
@@ -146,34 +153,33 @@ class StatisticsController:
         self.statistics_view.wait_for_user()
 
     def _show_simple_global_stats(self):
-        players = self.player_controller.get_all_players()
-        tournaments = self.tournament_controller.get_all_tournaments()
-
-        finished_tournaments = [
-            t for t in tournaments if t.is_finished()
-        ]
-        in_progress_tournaments = [
-            t for t in tournaments
-            if t.has_started() and not t.is_finished()
-        ]
-        not_started_tournaments = [
-            t for t in tournaments if not t.has_started()
-        ]
-        active_players_ids = set(
-            p.national_id for t in tournaments for p in t.players
-        )
+        players = self.player_controller.get_all_players_ref()
+        tournaments = self._get_tournaments()
+
+        finished = in_progress = not_started = 0
+        total_rounds = total_matches = 0
+        for tournament in tournaments:
+            if tournament.is_finished():
+                finished += 1
+            elif tournament.has_started():
+                in_progress += 1
+            else:
+                not_started += 1
+            total_rounds += len(tournament.rounds)
+            for round_obj in tournament.rounds:
+                total_matches += len(round_obj.matches)
 
         stats = {
             'total_players': len(players),
             'total_tournaments': len(tournaments),
-            'finished_tournaments': len(finished_tournaments),
-            'in_progress_tournaments': len(in_progress_tournaments),
-            'not_started_tournaments': len(not_started_tournaments),
-            'total_rounds': sum(len(t.rounds) for t in tournaments),
-            'total_matches': sum(
-                len(r.matches) for t in tournaments for r in t.rounds
-            ),
-            'active_players': len(active_players_ids)
+            'finished_tournaments': finished,
+            'in_progress_tournaments': in_progress,
+            'not_started_tournaments': not_started,
+            'total_rounds': total_rounds,
+            'total_matches': total_matches,
+            'active_players': len(
+                self.tournament_controller.get_active_player_ids()
+            )
         }
 
         self.statistics_view.display_simple_global_stats(stats)
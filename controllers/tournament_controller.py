@@ -1,27 +1,78 @@
-import os
-from typing import List, Dict
+import string
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import List, Dict, Optional, Set, KeysView
 
 from models.tournament import Tournament
 from models.match import Match
 from models.player import Player
-from views.tournament_view import TournamentView
+from views.tournament_view import TournamentView, SelectionChoice
 from data.data_manager import DataManager
-from utils.validators import validate_date_format, validate_tournament_dates
+from utils.validators import validate_tournament_dates
 from utils.tournament_helpers import TournamentPairingHelper
 from controllers.player_controller import PlayerController
 
+# Same character classes as [a-zA-ZÀ-ÿ0-9\s\-'.], checked with str.translate:
+# a valid value has nothing left once the allowed characters are deleted
+_NAME_CHARS = (
+    string.ascii_letters + string.digits + "-'." +
+    "".join(map(chr, range(0xC0, 0x100))) +
+    "".join(c for c in map(chr, range(0x3001)) if c.isspace())
+)
+_TOURNAMENT_NAME_DELETE = str.maketrans("", "", _NAME_CHARS)
+_LOCATION_DELETE = str.maketrans("", "", _NAME_CHARS + ",")
+
 
 class TournamentController:
 
-    def __init__(self, data_manager: DataManager, players: List[Player]):
+    def __init__(self, data_manager: DataManager, players: List[Player],
+                 player_controller: Optional[PlayerController] = None):
         self.data_manager = data_manager
         self.players = players
-        self.tournaments = self._load_all_tournaments()
+        self.player_controller = player_controller
+        # Tournaments load in the background while the main menu is shown
+        loader = ThreadPoolExecutor(max_workers=1)
+        self._tournaments_future = loader.submit(self._load_all_tournaments)
+        loader.shutdown(wait=False)
+        self._tournaments: Optional[List[Tournament]] = None
+        self._tournaments_by_id: Dict[int, Tournament] = {}
+        self._dirty_tournaments: Set[int] = set()
+        self._pending_saves: Dict[int, Future] = {}
+        self._last_selected_tournament: Optional[Tournament] = None
         self.tournament_view = TournamentView()
+        self._menu_handlers = {
+            "1": self._handle_create_tournament,
+            "2": self._handle_list_tournaments,
+            "3": self._handle_manage_tournament,
+            "4": self._handle_tournament_reports,
+        }
+        self._management_handlers = {
+            "1": self.tournament_view.show_tournament_details,
+            "2": self._handle_round_management,
+            "3": self._show_current_standings,
+            "4": self.tournament_view.show_tournament_history,
+            "5": self._handle_manage_players_in_tournament,
+        }
+        self._round_handlers = {
+            "1": self._handle_start_next_round,
+            "2": self._handle_enter_match_results,
+            "3": self._show_current_round_details,
+        }
+        self._post_round_handlers = {
+            "1": self._handle_enter_match_results_continuous,
+            "2": self._show_current_round_details,
+            "3": self._show_current_standings,
+        }
+        self._report_handlers = {
+            "1": self._generate_all_tournaments_report,
+            "2": self._generate_tournament_details_report,
+            "3": self._generate_rounds_report,
+            "4": self._generate_matches_report,
+        }
 
     def run(self):
         try:
             while True:
+                self._report_failed_saves()
                 choice = self.tournament_view.show_tournament_menu()
                 if not self._handle_tournament_menu_choice(choice):
                     break
@@ -30,32 +81,80 @@ class TournamentController:
                 f"Erreur dans le gestionnaire de tournois: {e}"
             )
 
+    @property
+    def tournaments(self) -> List[Tournament]:
+        if self._tournaments is None:
+            self._tournaments = self._tournaments_future.result()
+            self._tournaments_by_id = {t.id: t for t in self._tournaments}
+        return self._tournaments
+
     def get_all_tournaments(self) -> List[Tournament]:
         return self.tournaments.copy()
 
-    def update_players_data(self, new_players: List[Player]):
+    def get_active_player_ids(self) -> Set[str]:
+        return {
+            national_id
+            for tournament in self.tournaments
+            for national_id in tournament.player_ids
+        }
+
+    def update_players_data(self, new_players: List[Player],
+                            changed_ids: Set[str]):
         self.players = new_players
+        # Edited players must reach the tournament files even when the
+        # tournaments have not been opened yet
+        if changed_ids or self._tournaments is not None:
+            for tournament in self.tournaments:
+                # Renamed players can change the name-based tie order, and
+                # the tournament files embed the player records
+                if not changed_ids.isdisjoint(tournament.player_ids):
+                    tournament.reindex_players()
+                    tournament.invalidate_rankings()
+                    self._mark_tournament_dirty(tournament)
 
     def save_data(self):
-        for tournament in self.tournaments:
-            self._save_tournament(tournament)
+        # Every change either saves right away or marks its tournament dirty
+        self._flush_dirty_tournaments()
+        wait(list(self._pending_saves.values()))
+        self._report_failed_saves()
+
+    def _mark_tournament_dirty(self, tournament: Tournament):
+        self._dirty_tournaments.add(tournament.id)
+
+    def _flush_dirty_tournaments(self):
+        self._report_failed_saves()
+        for tournament_id in sorted(self._dirty_tournaments):
+            tournament = self._tournaments_by_id.get(tournament_id)
+            if tournament:
+                self._save_tournament(tournament)
+
+    def _report_failed_saves(self):
+        # Writes finish on the writer thread, failures show up here and
+        # the tournament stays dirty so the next flush retries it
+        for tournament_id, future in list(self._pending_saves.items()):
+            if not future.done():
+                continue
+            del self._pending_saves[tournament_id]
+            if future.result():
+                continue
+            self._dirty_tournaments.add(tournament_id)
+            tournament = self._tournaments_by_id.get(tournament_id)
+            name = tournament.name if tournament else tournament_id
+            self.tournament_view.show_error(
+                f"Erreur lors de la sauvegarde du tournoi '{name}'."
+            )
 
     def _handle_tournament_menu_choice(self, choice: str) -> bool:
-        handlers = {
-            "1": self._handle_create_tournament,
-            "2": self._handle_list_tournaments,
-            "3": self._handle_manage_tournament,
-            "4": self._handle_tournament_reports,
-            "0": lambda: False
-        }
-        handler = handlers.get(choice)
+        if choice == "0":
+            return False
+        handler = self._menu_handlers.get(choice)
         if handler:
-            return handler() if choice == "0" else (handler() or True)
+            handler()
         else:
             self.tournament_view.show_error(
                 "Choix invalide. Entrez 0, 1, 2, 3 ou 4."
             )
-            return True
+        return True
 
     def _handle_create_tournament(self):
         try:
@@ -64,6 +163,8 @@ class TournamentController:
                 return
             if not self._validate_tournament_data(data):
                 return
+            # The background load must be done before a new id is taken
+            tournaments = self.tournaments
             tournament = Tournament(
                 name=data['name'],
                 location=data['location'],
@@ -72,29 +173,35 @@ class TournamentController:
                 description=data.get('description', ''),
                 number_of_rounds=int(data.get('number_of_rounds', 4))
             )
-            self.tournaments.append(tournament)
+            tournaments.append(tournament)
+            self._tournaments_by_id[tournament.id] = tournament
+            # Saved by the flush that ends the player selection
+            self._mark_tournament_dirty(tournament)
             self._handle_add_players_to_tournament(tournament)
-            if self._save_tournament(tournament):
-                self.tournament_view.show_success(
-                    f"Tournoi '{tournament.name}' créé avec succès!"
-                )
-                if self._can_start_tournament(tournament):
-                    if self.tournament_view.confirm_start_first_round():
-                        self._handle_start_next_round(tournament)
-                else:
-                    self._show_tournament_creation_warnings(tournament)
+            self.tournament_view.show_success(
+                f"Tournoi '{tournament.name}' créé avec succès!"
+            )
+            if self._can_start_tournament(tournament):
+                if self.tournament_view.confirm_start_first_round():
+                    self._handle_start_next_round(tournament)
             else:
-                self.tournament_view.show_error(
-                    "Erreur lors de la sauvegarde."
-                )
+                self._show_tournament_creation_warnings(tournament)
         except Exception as e:
             self.tournament_view.show_error(
                 f"Erreur lors de la création: {e}"
             )
 
     def _handle_add_players_to_tournament(self, tournament: Tournament):
+        try:
+            self._add_players_to_tournament_loop(tournament)
+        finally:
+            self._flush_dirty_tournaments()
+
+    def _add_players_to_tournament_loop(self, tournament: Tournament):
         while True:
-            available_players = self._get_available_players(tournament)
+            available_players = self._get_available_players(
+                tournament.player_ids
+            )
             if not available_players:
                 self.tournament_view.show_info(
                     "Tous les joueurs ont été ajoutés."
@@ -103,12 +210,11 @@ class TournamentController:
             choice = self.tournament_view.show_player_selection_menu(
                 available_players, tournament.players
             )
-            if choice == "done":
+            if choice == SelectionChoice.DONE:
                 return
-            elif choice == "create":
+            elif choice == SelectionChoice.CREATE:
                 self._handle_create_new_player()
-            elif (isinstance(choice, int) and
-                  0 <= choice < len(available_players)):
+            elif 0 <= choice < len(available_players):
                 self._add_player_to_tournament(
                     tournament, available_players[choice]
                 )
@@ -123,38 +229,33 @@ class TournamentController:
         if not self.tournaments:
             self.tournament_view.show_info("Aucun tournoi disponible.")
             return
-        tournament = self.tournament_view.select_tournament(self.tournaments)
+        tournament = self._select_tournament()
         if tournament:
             self._handle_tournament_management_menu(tournament)
 
+    def _select_tournament(self) -> Optional[Tournament]:
+        tournament = self.tournament_view.select_tournament(
+            self.tournaments, self._last_selected_tournament
+        )
+        if tournament:
+            self._last_selected_tournament = tournament
+        return tournament
+
     def _handle_tournament_management_menu(self, tournament: Tournament):
-        while True:
-            choice = self.tournament_view.show_tournament_management_menu(
-                tournament
-            )
-            handlers = {
-                "1": lambda: self.tournament_view.show_tournament_details(
-                    tournament
-                ),
-                "2": lambda: self._handle_round_management(tournament),
-                "3": lambda: self.tournament_view.show_current_standings(
-                    tournament, tournament.get_current_rankings()
-                ),
-                "4": lambda: self.tournament_view.show_tournament_history(
-                    tournament
-                ),
-                "5": lambda: self._handle_manage_players_in_tournament(
+        try:
+            while True:
+                choice = self.tournament_view.show_tournament_management_menu(
                     tournament
-                ),
-                "0": lambda: False
-            }
-            handler = handlers.get(choice)
-            if handler:
-                result = handler()
-                if result is False:
+                )
+                if choice == "0":
                     break
-            else:
-                self.tournament_view.show_error("Choix invalide.")
+                handler = self._management_handlers.get(choice)
+                if handler:
+                    handler(tournament)
+                else:
+                    self.tournament_view.show_error("Choix invalide.")
+        finally:
+            self._flush_dirty_tournaments()
 
     def _handle_round_management(self, tournament: Tournament):
         while True:
@@ -165,19 +266,11 @@ class TournamentController:
             choice = self.tournament_view.show_round_management_menu(
                 tournament
             )
-            handlers = {
-                "1": lambda: self._handle_start_next_round(tournament),
-                "2": lambda: self._handle_enter_match_results(tournament),
-                "3": lambda: self.tournament_view.show_round_details(
-                    tournament.rounds[-1] if tournament.rounds else None
-                ),
-                "0": lambda: False
-            }
-            handler = handlers.get(choice)
+            if choice == "0":
+                break
+            handler = self._round_handlers.get(choice)
             if handler:
-                result = handler()
-                if result is False:
-                    break
+                handler(tournament)
                 if tournament.is_finished():
                     self._handle_tournament_finished_workflow(tournament)
                     return
@@ -185,7 +278,7 @@ class TournamentController:
                 self.tournament_view.show_error("Choix invalide.")
 
     def _handle_tournament_finished_workflow(self, tournament: Tournament):
-        if hasattr(tournament, '_results_displayed'):
+        if tournament._results_displayed:
             return
         tournament._results_displayed = True
         self.tournament_view.announce_tournament_end(tournament)
@@ -210,15 +303,11 @@ class TournamentController:
             ):
                 return
             tournament.start_next_round(pairs)
-            if self._save_tournament(tournament):
-                self.tournament_view.show_success(
-                    f"Tour {round_number} démarré avec succès!"
-                )
-                self._handle_post_round_start_workflow(tournament)
-            else:
-                self.tournament_view.show_error(
-                    "Erreur lors de la sauvegarde."
-                )
+            self._save_tournament(tournament)
+            self.tournament_view.show_success(
+                f"Tour {round_number} démarré avec succès!"
+            )
+            self._handle_post_round_start_workflow(tournament)
         except Exception as e:
             self.tournament_view.show_error(
                 f"Erreur lors du démarrage du tour: {e}"
@@ -229,27 +318,22 @@ class TournamentController:
             if tournament.is_finished():
                 return
             choice = self.tournament_view.show_post_round_start_menu()
-            if choice == "1":
-                self._handle_enter_match_results_continuous(tournament)
-                if tournament.is_finished():
-                    return
-            elif choice == "2":
-                current_round = (tournament.rounds[-1]
-                                 if tournament.rounds else None)
-                if current_round:
-                    self.tournament_view.show_round_details(current_round)
-                else:
-                    self.tournament_view.show_info("Aucun tour disponible.")
-            elif choice == "3":
-                rankings = tournament.get_current_rankings()
-                self.tournament_view.show_current_standings(
-                    tournament, rankings
-                )
-            elif choice in ["4", "5", "0"]:
+            if choice in ("4", "5", "0"):
                 break
+            handler = self._post_round_handlers.get(choice)
+            if handler:
+                handler(tournament)
             else:
                 self.tournament_view.show_error("Choix invalide.")
 
+    def _show_current_round_details(self, tournament: Tournament):
+        self.tournament_view.show_round_details(tournament.current_round_obj)
+
+    def _show_current_standings(self, tournament: Tournament):
+        self.tournament_view.show_current_standings(
+            tournament, tournament.get_current_rankings_with_scores()
+        )
+
     def _handle_enter_match_results(self, tournament: Tournament):
         if not tournament.has_started():
             self.tournament_view.show_info(
@@ -259,8 +343,7 @@ class TournamentController:
         if tournament.is_finished():
             self.tournament_view.show_info("Le tournoi est terminé.")
             return
-        current_round = (tournament.rounds[-1]
-                         if tournament.rounds else None)
+        current_round = tournament.current_round_obj
         if not current_round:
             self.tournament_view.show_info("Aucun tour disponible.")
             return
@@ -272,47 +355,54 @@ class TournamentController:
                 if self.tournament_view.confirm_next_round_immediate():
                     self._handle_start_next_round(tournament)
             return
-        unfinished_matches = current_round.get_unfinished_matches()
-        if not unfinished_matches:
+        if not current_round.unfinished_count:
             self.tournament_view.show_info("Finalisation du tour en cours...")
             self._auto_finish_completed_rounds_silent(tournament)
             return
         self._handle_enter_match_results_continuous(tournament)
 
     def _handle_enter_match_results_continuous(self, tournament: Tournament):
+        try:
+            self._enter_match_results_loop(tournament)
+        finally:
+            self._flush_dirty_tournaments()
+
+    def _enter_match_results_loop(self, tournament: Tournament):
+        current_round = None
+        unfinished_matches: List[Match] = []
         while True:
             if tournament.is_finished():
                 return
-            current_round = (tournament.rounds[-1]
-                             if tournament.rounds else None)
-            if not current_round or current_round.is_finished:
-                return
-            unfinished_matches = current_round.get_unfinished_matches()
-            if not unfinished_matches:
+            # The unfinished list is only rebuilt when a new round starts
+            latest_round = tournament.current_round_obj
+            if latest_round is not current_round:
+                current_round = latest_round
+                unfinished_matches = (current_round.get_unfinished_matches()
+                                      if current_round else [])
+            if (not current_round or current_round.is_finished or
+                    not unfinished_matches):
                 return
             match_choice = self.tournament_view.select_match_for_results(
                 current_round, unfinished_matches, tournament
             )
-            if match_choice == "back":
+            if match_choice == SelectionChoice.BACK:
                 return
-            elif (isinstance(match_choice, int) and
-                  0 <= match_choice < len(unfinished_matches)):
-                result = self._handle_single_match_result(
-                    tournament, unfinished_matches[match_choice]
-                )
-                if tournament.is_finished():
-                    return
-                if not result:
-                    continue
+            elif 0 <= match_choice < len(unfinished_matches):
+                match = unfinished_matches[match_choice]
+                self._handle_single_match_result(tournament, match)
+                if match.is_finished:
+                    unfinished_matches.pop(match_choice)
 
     def _handle_single_match_result(self, tournament: Tournament,
                                     match: Match) -> bool:
         result = self.tournament_view.get_match_result_input(
-            match, tournament.players
+            match, tournament
         )
 
         if result:
-            match.set_result(result['player1_score'], result['player2_score'])
+            tournament.current_round_obj.set_match_result(
+                match, result['player1_score'], result['player2_score']
+            )
             tournament.add_score_to_player(
                 match.player1_national_id, match.player1_score
             )
@@ -320,26 +410,18 @@ class TournamentController:
                 match.player2_national_id, match.player2_score
             )
 
-            if self._save_tournament(tournament):
-                self.tournament_view.announce_match_result(
-                    match, tournament.players
-                )
+            self._mark_tournament_dirty(tournament)
+            self.tournament_view.announce_match_result(match, tournament)
 
-                current_round = (tournament.rounds[-1]
-                                 if tournament.rounds else None)
-                if current_round and current_round.all_matches_finished():
-                    self._auto_finish_completed_rounds_silent(tournament)
+            current_round = tournament.current_round_obj
+            if current_round and current_round.all_matches_finished():
+                self._auto_finish_completed_rounds_silent(tournament)
 
-                    if tournament.is_finished():
-                        self._handle_tournament_finished_workflow(tournament)
-                        return False
+                if tournament.is_finished():
+                    self._handle_tournament_finished_workflow(tournament)
+                    return False
 
-                return True
-            else:
-                self.tournament_view.show_error(
-                    "Erreur lors de la sauvegarde."
-                )
-                return False
+            return True
         return False
 
     def _auto_finish_completed_rounds_silent(self, tournament: Tournament):
@@ -353,13 +435,9 @@ class TournamentController:
                 current_round.end_round()
                 if tournament.current_round >= tournament.number_of_rounds:
                     tournament.finish_tournament()
-                if self._save_tournament(tournament):
-                    if not tournament.is_finished():
-                        self._handle_round_completion_workflow(tournament)
-                else:
-                    self.tournament_view.show_error(
-                        "Erreur lors de la sauvegarde."
-                    )
+                self._save_tournament(tournament)
+                if not tournament.is_finished():
+                    self._handle_round_completion_workflow(tournament)
             except Exception as e:
                 self.tournament_view.show_error(
                     f"Erreur lors de la finalisation: {e}"
@@ -368,10 +446,10 @@ class TournamentController:
     def _handle_round_completion_workflow(self, tournament: Tournament):
         if tournament.current_round >= tournament.number_of_rounds:
             tournament.finish_tournament()
+            self._mark_tournament_dirty(tournament)
             return
 
-        current_round = (tournament.rounds[-1]
-                         if tournament.rounds else None)
+        current_round = tournament.current_round_obj
         if current_round:
             round_name = current_round.name
             self.tournament_view.show_success(f"{round_name} terminé!")
@@ -380,41 +458,40 @@ class TournamentController:
             self._handle_start_next_round(tournament)
 
     def _validate_next_round_conditions(self, tournament: Tournament) -> Dict:
-        if len(tournament.players) < 2:
+        player_count = tournament.player_count
+        if player_count < 2:
             return {
                 'can_start': False,
                 'error_message': ("Il faut au moins 2 joueurs pour "
                                   "commencer un tournoi.")
             }
-        if len(tournament.players) % 2 != 0:
+        if player_count % 2 != 0:
             return {
                 'can_start': False,
                 'error_message': (f"Il faut un nombre PAIR de joueurs. "
-                                  f"Vous en avez {len(tournament.players)}.")
+                                  f"Vous en avez {player_count}.")
             }
         if tournament.is_finished():
             return {
                 'can_start': False,
                 'error_message': "Ce tournoi est terminé."
             }
-        if tournament.rounds:
-            current_round = tournament.rounds[-1]
-            if (not current_round.is_finished and
-                    current_round.all_matches_finished()):
+        current_round = tournament.current_round_obj
+        if current_round and not current_round.is_finished:
+            unfinished_count = current_round.unfinished_count
+            if not unfinished_count:
                 return {
                     'can_start': False,
                     'error_message': ("Le tour actuel doit être finalisé. "
                                       "Utilisez 'Saisir résultats' pour "
                                       "le terminer.")
                 }
-            if not current_round.is_finished:
-                unfinished_count = len(current_round.get_unfinished_matches())
-                return {
-                    'can_start': False,
-                    'error_message': (f"Le tour actuel n'est pas terminé "
-                                      f"({unfinished_count} match(s) "
-                                      f"restant(s)).")
-                }
+            return {
+                'can_start': False,
+                'error_message': (f"Le tour actuel n'est pas terminé "
+                                  f"({unfinished_count} match(s) "
+                                  f"restant(s)).")
+            }
         if tournament.current_round >= tournament.number_of_rounds:
             return {
                 'can_start': False,
@@ -429,16 +506,6 @@ class TournamentController:
         if not self._validate_location_flexible(data['location']):
             self.tournament_view.show_error("Lieu invalide.")
             return False
-        if not validate_date_format(data['start_date']):
-            self.tournament_view.show_error(
-                "Format de date de début invalide (YYYY-MM-DD)."
-            )
-            return False
-        if not validate_date_format(data['end_date']):
-            self.tournament_view.show_error(
-                "Format de date de fin invalide (YYYY-MM-DD)."
-            )
-            return False
         dates_valid, error_message = validate_tournament_dates(
             data['start_date'],
             data['end_date']
@@ -466,9 +533,7 @@ class TournamentController:
         name = name.strip()
         if len(name) < 1 or len(name) > 100:
             return False
-        import re
-        pattern = r"^[a-zA-ZÀ-ÿ0-9\s\-'\.]+$"
-        return bool(re.match(pattern, name))
+        return not name.translate(_TOURNAMENT_NAME_DELETE)
 
     def _validate_location_flexible(self, location: str) -> bool:
         if not location or not isinstance(location, str):
@@ -476,59 +541,50 @@ class TournamentController:
         location = location.strip()
         if len(location) < 1 or len(location) > 200:
             return False
-        import re
-        pattern = r"^[a-zA-ZÀ-ÿ0-9\s\-',\.]+$"
-        return bool(re.match(pattern, location))
+        return not location.translate(_LOCATION_DELETE)
 
     def _can_start_tournament(self, tournament: Tournament) -> bool:
-        return (len(tournament.players) >= 2 and
-                len(tournament.players) % 2 == 0)
+        return tournament.is_startable
 
     def _show_tournament_creation_warnings(self, tournament: Tournament):
-        if len(tournament.players) < 2:
+        if tournament.player_count < 2:
             self.tournament_view.show_warning(
                 "Il faut au moins 2 joueurs pour démarrer un tour."
             )
-        elif len(tournament.players) % 2 != 0:
+        elif not tournament.is_startable:
             self.tournament_view.show_warning(
                 "Le nombre de joueurs est impair. Ajoutez un joueur."
             )
 
-    def _get_available_players(self, tournament: Tournament) -> List[Player]:
-        return [
-            p for p in self.players
-            if p.national_id not in [tp.national_id for tp in
-                                     tournament.players]
-        ]
+    def _get_available_players(self,
+                               excluded_ids: KeysView[str]) -> List[Player]:
+        return [p for p in self.players if p.national_id not in excluded_ids]
 
     def _add_player_to_tournament(self, tournament: Tournament,
                                   player: Player) -> bool:
         try:
             tournament.add_player(player)
-            if self.data_manager.save_tournament(tournament):
-                self.tournament_view.show_success(
-                    f"{player.get_full_name()} ajouté au tournoi."
-                )
-                return True
-            else:
-                tournament.remove_player(player)
-                self.tournament_view.show_error(
-                    "Erreur lors de la sauvegarde."
-                )
-                return False
+            self._mark_tournament_dirty(tournament)
+            self.tournament_view.show_success(
+                f"{player.get_full_name()} ajouté au tournoi."
+            )
+            return True
         except Exception as e:
             self.tournament_view.show_error(f"Erreur lors de l'ajout: {e}")
             return False
 
     def _handle_create_new_player(self):
-        player_controller = PlayerController(self.data_manager, self.players)
-        player_controller._handle_add_player()
-        self.players = self.data_manager.load_players()
+        player_controller = (self.player_controller or
+                             PlayerController(self.data_manager, self.players))
+        new_player = player_controller._handle_add_player()
+        if new_player is None:
+            return
+        if player_controller.get_all_players_ref() is not self.players:
+            self.players.append(new_player)
 
     def _handle_manage_players_in_tournament(self, tournament: Tournament):
         if not tournament.has_started():
             self._handle_add_players_to_tournament(tournament)
-            self._save_tournament(tournament)
         else:
             self.tournament_view.show_error(
                 "Impossible d'ajouter des joueurs après le début du tournoi."
@@ -536,23 +592,19 @@ class TournamentController:
 
     def _handle_tournament_reports(self):
         choice = self.tournament_view.show_reports_menu()
-        report_handlers = {
-            "1": (lambda: self.tournament_view.show_all_tournaments_report(
-                self.tournaments
-            ) if self.tournaments else None),
-            "2": self._generate_tournament_details_report,
-            "3": self._generate_rounds_report,
-            "4": self._generate_matches_report
-        }
-        handler = report_handlers.get(choice)
+        handler = self._report_handlers.get(choice)
         if handler:
             handler()
 
+    def _generate_all_tournaments_report(self):
+        if self.tournaments:
+            self.tournament_view.show_all_tournaments_report(self.tournaments)
+
     def _generate_tournament_details_report(self):
         if not self.tournaments:
             self.tournament_view.show_info("Aucun tournoi disponible.")
             return
-        tournament = self.tournament_view.select_tournament(self.tournaments)
+        tournament = self._select_tournament()
         if tournament:
             self.tournament_view.show_detailed_tournament_report(tournament)
 
@@ -560,7 +612,7 @@ class TournamentController:
         if not self.tournaments:
             self.tournament_view.show_info("Aucun tournoi disponible.")
             return
-        tournament = self.tournament_view.select_tournament(self.tournaments)
+        tournament = self._select_tournament()
         if tournament and tournament.rounds:
             self.tournament_view.show_rounds_report(tournament)
         elif tournament:
@@ -572,7 +624,7 @@ class TournamentController:
         if not self.tournaments:
             self.tournament_view.show_info("Aucun tournoi disponible.")
             return
-        tournament = self.tournament_view.select_tournament(self.tournaments)
+        tournament = self._select_tournament()
         if tournament and tournament.rounds:
             self.tournament_view.show_matches_report(tournament)
         elif tournament:
@@ -581,22 +633,11 @@ class TournamentController:
             )
 
     def _load_all_tournaments(self) -> List[Tournament]:
-        tournaments = []
         players_lookup = {p.national_id: p for p in self.players}
-        for file_path in self.data_manager.get_all_tournament_files():
-            try:
-                filename = os.path.basename(file_path)
-                tournament_id = int(
-                    filename.replace('tournament_', '').replace('.json', '')
-                )
-                tournament = self.data_manager.load_tournament(
-                    tournament_id, players_lookup
-                )
-                if tournament:
-                    tournaments.append(tournament)
-            except Exception as e:
-                print(f"Erreur chargement tournoi {file_path}: {e}")
-        return tournaments
+        return self.data_manager.load_all_tournaments(players_lookup)
 
-    def _save_tournament(self, tournament: Tournament) -> bool:
-        return self.data_manager.save_tournament(tournament)
+    def _save_tournament(self, tournament: Tournament):
+        self._pending_saves[tournament.id] = (
+            self.data_manager.save_tournament(tournament)
+        )
+        self._dirty_tournaments.discard(tournament.id)
@@ -0,0 +1,62 @@
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.file_utils import safe_json_save
+
+
+class AsyncJsonWriter:
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, file_path: str, data: Any,
+               on_saved: Optional[Callable[[], None]] = None) -> Future:
+        future: Future = Future()
+        self._queue.put((file_path, data, on_saved, future))
+        return future
+
+    def flush(self):
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            items = [self._queue.get()]
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            # Only the latest snapshot of each file matters, older ones
+            # are dropped and share its result
+            latest: Dict[str, tuple] = {}
+            futures: Dict[str, List[Future]] = {}
+            for file_path, data, on_saved, future in items:
+                latest[file_path] = (data, on_saved)
+                futures.setdefault(file_path, []).append(future)
+
+            try:
+                for file_path, (data, on_saved) in latest.items():
+                    saved = self._write(file_path, data, on_saved)
+                    for future in futures[file_path]:
+                        future.set_result(saved)
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+
+    @staticmethod
+    def _write(file_path: str, data: Any,
+               on_saved: Optional[Callable[[], None]]) -> bool:
+        try:
+            if not safe_json_save(data, file_path):
+                return False
+            if on_saved:
+                on_saved()
+            return True
+        except Exception as e:
+            print(f"Erreur écriture asynchrone {file_path}: {e}")
+            return False
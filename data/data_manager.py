@@ -1,23 +1,43 @@
 import os
-from typing import List, Optional, Dict
+import re
+import json
+import atexit
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Dict, Tuple
 from models.player import Player
 from models.tournament import Tournament
+from data.async_writer import AsyncJsonWriter
 from utils.file_utils import (
     ensure_directory_exists,
-    safe_json_save,
     safe_json_load
 )
 
 
+JOURNAL_COMPACT_BYTES = 64 * 1024
+JOURNAL_FSYNC_EVERY = 16
+TOURNAMENT_LOAD_WORKERS = 8
+TOURNAMENT_PARALLEL_MIN_FILES = 4
+
+_TOURNAMENT_FILE_RE = re.compile(r"tournament_(\d+)\.json")
+
+
 class DataManager:
 
     def __init__(self, data_dir: str = "data"):
         self.data_dir = data_dir
         self.players_file = os.path.join(data_dir, "players.json")
+        self.players_journal = os.path.join(data_dir, "players.journal")
         self.tournaments_dir = os.path.join(data_dir, "tournaments")
 
         self._init_data_directories()
 
+        self._journal_lock = threading.Lock()
+        self._journal_seq = 0
+        self._journal_unsynced = 0
+        self._writer = AsyncJsonWriter()
+        atexit.register(self.flush)
+
         self._stats = {
             'saves_count': 0,
             'loads_count': 0,
@@ -34,14 +54,15 @@ class DataManager:
                 f"Impossible de créer les répertoires de données: {e}"
             )
 
-    def save_players(self, players: List[Player]) -> bool:
+    def save_players(self, players: List[Player]) -> Future:
+        """The returned future resolves to False if the write fails"""
         try:
             self._stats['last_operation'] = (
                 f"save_players_{len(players)}_players"
             )
 
             if not self._validate_players_data(players):
-                return False
+                return self._failed_save()
 
             players_data = []
             for player in players:
@@ -53,17 +74,45 @@ class DataManager:
                     self._stats['errors_count'] += 1
                     continue
 
-            success = safe_json_save(players_data, self.players_file)
+            journal_seq = self._journal_seq
+            return self._writer.submit(
+                self.players_file, players_data,
+                lambda: self._on_players_saved(journal_seq)
+            )
 
-            if success:
-                self._stats['saves_count'] += 1
-                return True
+        except Exception as e:
+            print(f"Erreur sauvegarde joueurs: {e}")
+            self._stats['errors_count'] += 1
+            return self._failed_save()
+
+    def save_player(self, player: Player, op: str,
+                    previous_id: Optional[str] = None) -> bool:
+        try:
+            self._stats['last_operation'] = f"save_player_{op}"
+
+            if op == "delete":
+                record = {"op": op, "national_id": player.national_id}
             else:
-                self._stats['errors_count'] += 1
-                return False
+                record = {"op": op, "player": player.to_dict()}
+                if previous_id and previous_id != player.national_id:
+                    record["previous_id"] = previous_id
+
+            with self._journal_lock:
+                with open(self.players_journal, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    # Records reach the OS on close, the disk once per batch
+                    self._journal_unsynced += 1
+                    if self._journal_unsynced >= JOURNAL_FSYNC_EVERY:
+                        f.flush()
+                        os.fsync(f.fileno())
+                        self._journal_unsynced = 0
+                self._journal_seq += 1
+
+            self._stats['saves_count'] += 1
+            return True
 
         except Exception as e:
-            print(f"Erreur sauvegarde joueurs: {e}")
+            print(f"Erreur journalisation joueur {player}: {e}")
             self._stats['errors_count'] += 1
             return False
 
@@ -71,9 +120,7 @@ class DataManager:
         try:
             self._stats['last_operation'] = "load_players"
 
-            players_data = safe_json_load(self.players_file)
-            if not players_data:
-                return []
+            players_data = safe_json_load(self.players_file) or []
 
             players = []
             for i, player_data in enumerate(players_data):
@@ -96,6 +143,12 @@ class DataManager:
                     self._stats['errors_count'] += 1
                     continue
 
+            if os.path.exists(self.players_journal):
+                players = self._replay_players_journal(players)
+                if (os.path.getsize(self.players_journal) >
+                        JOURNAL_COMPACT_BYTES):
+                    self.save_players(players)
+
             self._stats['loads_count'] += 1
             print(f"Chargement réussi: {len(players)} joueurs")
             return players
@@ -124,31 +177,27 @@ class DataManager:
 
             return []
 
-    def save_tournament(self, tournament: Tournament) -> bool:
+    def save_tournament(self, tournament: Tournament) -> Future:
+        """The returned future resolves to False if the write fails"""
         try:
             self._stats['last_operation'] = f"save_tournament_{tournament.id}"
 
-            if not self._validate_tournament_data(tournament):
-                return False
-
-            filename = f"tournament_{tournament.id}.json"
-            file_path = os.path.join(self.tournaments_dir, filename)
-
-            tournament_data = tournament.to_dict()
-
-            success = safe_json_save(tournament_data, file_path)
-
-            if success:
-                self._stats['saves_count'] += 1
-                return True
-            else:
-                self._stats['errors_count'] += 1
-                return False
+            if self._validate_tournament_data(tournament):
+                return self._writer.submit(
+                    self._tournament_path(tournament.id),
+                    tournament.to_dict(), self._on_tournament_saved
+                )
 
         except Exception as e:
             print(f"Erreur sauvegarde tournoi {tournament.id}: {e}")
             self._stats['errors_count'] += 1
-            return False
+        return self._failed_save()
+
+    @staticmethod
+    def _failed_save() -> Future:
+        failed: Future = Future()
+        failed.set_result(False)
+        return failed
 
     def load_tournament(self, tournament_id: int,
                         players_lookup: Dict[str, Player]) -> Optional[Tournament]:
@@ -162,18 +211,11 @@ class DataManager:
                 return None
 
             tournament_data = safe_json_load(file_path)
-            if not tournament_data:
-                return None
-
-            if not self._validate_tournament_dict(tournament_data):
-                print(
-                    f"ERREUR: Données du tournoi {tournament_id} invalides"
-                )
-                return None
-
-            tournament = Tournament.from_dict(tournament_data, players_lookup)
-
-            self._stats['loads_count'] += 1
+            tournament = self._build_tournament(
+                tournament_id, tournament_data, players_lookup
+            )
+            if tournament:
+                Tournament.reserve_ids(max(tournament_id, tournament.id))
             return tournament
 
         except Exception as e:
@@ -181,29 +223,92 @@ class DataManager:
             self._stats['errors_count'] += 1
             return None
 
+    def load_all_tournaments(self,
+                             players_lookup: Dict[str, Player]) -> List[Tournament]:
+        entries = self._get_tournament_file_entries()
+        if not entries:
+            return []
+        file_paths = [path for _, path in entries]
+
+        # Only the file reads and JSON parsing run in the pool, the
+        # Tournament objects are built in order on the calling thread
+        if len(file_paths) < TOURNAMENT_PARALLEL_MIN_FILES:
+            raw_tournaments = [safe_json_load(path) for path in file_paths]
+        else:
+            workers = min(TOURNAMENT_LOAD_WORKERS, len(file_paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                raw_tournaments = list(
+                    executor.map(safe_json_load, file_paths)
+                )
+
+        tournaments = []
+        for (tournament_id, _), tournament_data in zip(entries,
+                                                       raw_tournaments):
+            try:
+                tournament = self._build_tournament(
+                    tournament_id, tournament_data, players_lookup
+                )
+            except Exception as e:
+                print(f"Erreur chargement tournoi {tournament_id}: {e}")
+                self._stats['errors_count'] += 1
+                continue
+            if tournament:
+                tournaments.append(tournament)
+        # New tournaments must not reuse the id of any file on disk
+        Tournament.reserve_ids(max(
+            [tournament_id for tournament_id, _ in entries] +
+            [tournament.id for tournament in tournaments]
+        ))
+        return tournaments
+
+    def _build_tournament(self, tournament_id: int, tournament_data,
+                          players_lookup: Dict[str, Player]) -> Optional[Tournament]:
+        if not tournament_data:
+            return None
+
+        if not self._validate_tournament_dict(tournament_data):
+            print(
+                f"ERREUR: Données du tournoi {tournament_id} invalides"
+            )
+            return None
+
+        tournament = Tournament.from_dict(tournament_data, players_lookup)
+
+        self._stats['loads_count'] += 1
+        return tournament
+
     def get_all_tournament_files(self) -> List[str]:
+        return [path for _, path in self._get_tournament_file_entries()]
+
+    def _get_tournament_file_entries(self) -> List[Tuple[int, str]]:
         try:
             if not os.path.exists(self.tournaments_dir):
                 return []
 
-            files = []
-            for filename in os.listdir(self.tournaments_dir):
-                if (filename.startswith("tournament_") and
-                        filename.endswith(".json") and
-                        not filename.endswith(".backup")):
-                    files.append(
-                        os.path.join(self.tournaments_dir, filename)
-                    )
+            entries = []
+            with os.scandir(self.tournaments_dir) as it:
+                for entry in it:
+                    match = _TOURNAMENT_FILE_RE.fullmatch(entry.name)
+                    if match:
+                        entries.append((int(match.group(1)), entry.path))
 
-            files.sort(key=lambda x: self._extract_tournament_id(x))
-            return files
+            entries.sort()
+            return entries
 
         except Exception as e:
             print(f"Erreur lecture répertoire tournois: {e}")
             return []
 
+    def _tournament_path(self, tournament_id: int) -> str:
+        filename = f"tournament_{tournament_id}.json"
+        return os.path.join(self.tournaments_dir, filename)
+
+    def _on_tournament_saved(self):
+        self._stats['saves_count'] += 1
+
     def delete_tournament(self, tournament_id: int) -> bool:
         try:
+            self._writer.flush()
             filename = f"tournament_{tournament_id}.json"
             file_path = os.path.join(self.tournaments_dir, filename)
 
@@ -219,6 +324,60 @@ class DataManager:
             print(f"Erreur suppression tournoi {tournament_id}: {e}")
             return False
 
+    def _replay_players_journal(self, players: List[Player]) -> List[Player]:
+        players_by_id = {p.national_id: p for p in players}
+        with open(self.players_journal, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    if record["op"] == "delete":
+                        players_by_id.pop(record["national_id"], None)
+                        continue
+                    player = Player.from_dict(record["player"])
+                    players_by_id.pop(record.get("previous_id"), None)
+                    players_by_id[player.national_id] = player
+                except Exception as e:
+                    print(
+                        f"ATTENTION: Entrée {line_number} du journal "
+                        f"ignorée: {e}"
+                    )
+                    self._stats['errors_count'] += 1
+        return list(players_by_id.values())
+
+    def flush(self):
+        self._writer.flush()
+        self._sync_players_journal()
+
+    def _sync_players_journal(self):
+        with self._journal_lock:
+            if not self._journal_unsynced:
+                return
+            try:
+                if os.path.exists(self.players_journal):
+                    with open(self.players_journal, 'a',
+                              encoding='utf-8') as f:
+                        os.fsync(f.fileno())
+                self._journal_unsynced = 0
+            except Exception as e:
+                print(f"Erreur synchronisation journal joueurs: {e}")
+
+    def _on_players_saved(self, journal_seq: int):
+        with self._journal_lock:
+            self._stats['saves_count'] += 1
+            if journal_seq != self._journal_seq:
+                return
+            self._clear_players_journal()
+            self._journal_unsynced = 0
+
+    def _clear_players_journal(self):
+        try:
+            if os.path.exists(self.players_journal):
+                os.remove(self.players_journal)
+        except Exception as e:
+            print(f"Erreur suppression journal joueurs: {e}")
+
     def _find_latest_backup(self, original_file: str) -> Optional[str]:
         """Find the latest backup file for the given original file."""
         try:
@@ -268,11 +427,3 @@ class DataManager:
     def _validate_tournament_dict(self, tournament_data: Dict) -> bool:
         required_fields = ["id", "name", "location", "start_date", "end_date"]
         return all(field in tournament_data for field in required_fields)
-
-    def _extract_tournament_id(self, file_path: str) -> int:
-        try:
-            filename = os.path.basename(file_path)
-            id_str = filename.replace("tournament_", "").replace(".json", "")
-            return int(id_str)
-        except Exception:
-            return 0
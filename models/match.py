@@ -1,3 +1,4 @@
+import sys
 from typing import Optional, Tuple, List
 
 from utils.validators import validate_score
@@ -5,6 +6,10 @@ from utils.match_helpers import MatchAnalysisHelper
 
 
 class Match:
+    __slots__ = (
+        'player1_national_id', 'player2_national_id',
+        'player1_score', 'player2_score', 'is_finished'
+    )
 
     def __init__(self, player1_national_id: str, player2_national_id: str):
         if player1_national_id == player2_national_id:
@@ -16,11 +21,14 @@ class Match:
         self.player2_score = 0.0
         self.is_finished = False
 
-    def set_result(self, player1_score: float, player2_score: float):
+    # Results go through Round.set_match_result, which keeps its count of
+    # unfinished matches in step
+    def _set_result(self, player1_score: float, player2_score: float):
         if not validate_score(player1_score) or not validate_score(player2_score):
             raise ValueError("Les scores doivent être 0, 0.5 ou 1")
 
-        if abs(player1_score + player2_score - 1.0) > 0.001:
+        # Scores are whole half-points, so their sum is exact
+        if player1_score + player2_score != 1:
             raise ValueError("La somme des scores doit être égale à 1.0")
 
         self.player1_score = float(player1_score)
@@ -53,7 +61,7 @@ class Match:
 
     def is_draw(self) -> bool:
         return (self.is_finished and
-                abs(self.player1_score - self.player2_score) < 0.001)
+                self.player1_score == self.player2_score)
 
     def involves_player(self, national_id: str) -> bool:
         return (national_id == self.player1_national_id or
@@ -86,8 +94,8 @@ class Match:
                 raise KeyError(f"Champ requis manquant: {field}")
 
         match = Match(
-            player1_national_id=data["player1_national_id"],
-            player2_national_id=data["player2_national_id"]
+            player1_national_id=sys.intern(data["player1_national_id"]),
+            player2_national_id=sys.intern(data["player2_national_id"])
         )
 
         match.player1_score = data.get("player1_score", 0.0)
@@ -1,3 +1,5 @@
+import sys
+from datetime import date
 from typing import Optional
 
 from utils.validators import (
@@ -9,14 +11,23 @@ from utils.date_utils import calculate_age
 
 
 class Player:
+    __slots__ = (
+        '_last_name', '_first_name', '_birthdate', '_national_id',
+        '_sort_key', '_full_name', '_dict_cache', '_age_cache_key',
+        '_age_cache'
+    )
+
     def __init__(self, last_name: str, first_name: str, birthdate: str,
                  national_id: str):
         self._validate_data(last_name, first_name, birthdate, national_id)
 
-        self.last_name = last_name.strip().title()
-        self.first_name = first_name.strip().title()
-        self.birthdate = birthdate.strip()
-        self.national_id = national_id.strip().upper()
+        self._last_name = last_name.strip().title()
+        self._first_name = first_name.strip().title()
+        self._birthdate = birthdate.strip()
+        self._national_id = Player.normalize_id(national_id)
+        self._refresh_name_cache()
+        self._age_cache_key = None
+        self._age_cache: Optional[int] = None
 
     def _validate_data(self, last_name: str, first_name: str, birthdate: str,
                        national_id: str):
@@ -33,20 +44,77 @@ class Player:
                 "Identifiant national invalide (format: AB12345)"
             )
 
+    @staticmethod
+    def normalize_id(national_id: str) -> str:
+        # Interned so that id lookups and comparisons hit the identity fast path
+        return sys.intern(national_id.strip().upper())
+
+    # The setters keep the derived values in step with the fields
+
+    @property
+    def last_name(self) -> str:
+        return self._last_name
+
+    @last_name.setter
+    def last_name(self, value: str):
+        self._last_name = value
+        self._refresh_name_cache()
+
+    @property
+    def first_name(self) -> str:
+        return self._first_name
+
+    @first_name.setter
+    def first_name(self, value: str):
+        self._first_name = value
+        self._refresh_name_cache()
+
+    @property
+    def birthdate(self) -> str:
+        return self._birthdate
+
+    @birthdate.setter
+    def birthdate(self, value: str):
+        self._birthdate = value
+        self._dict_cache = None
+
+    @property
+    def national_id(self) -> str:
+        return self._national_id
+
+    @national_id.setter
+    def national_id(self, value: str):
+        self._national_id = value
+        self._dict_cache = None
+
+    def _refresh_name_cache(self):
+        self._sort_key = (self._last_name.lower(), self._first_name.lower())
+        self._full_name = f"{self._first_name} {self._last_name}"
+        self._dict_cache = None
+
     def get_full_name(self) -> str:
-        return f"{self.first_name} {self.last_name}"
+        return self._full_name
 
     def calculate_age(self, reference_date: Optional[str] = None) -> Optional[int]:
-        return calculate_age(self.birthdate, reference_date)
+        if reference_date is not None:
+            return calculate_age(self.birthdate, reference_date)
+        # Cache keyed on the birthdate so that edits invalidate it for free
+        key = (self.birthdate, date.today())
+        if self._age_cache_key != key:
+            self._age_cache = calculate_age(self.birthdate)
+            self._age_cache_key = key
+        return self._age_cache
 
     def to_dict(self) -> dict:
-        """Sérialisation simple"""
-        return {
-            "last_name": self.last_name,
-            "first_name": self.first_name,
-            "birthdate": self.birthdate,
-            "national_id": self.national_id
-        }
+        """Sérialisation simple (mise en cache)"""
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "last_name": self.last_name,
+                "first_name": self.first_name,
+                "birthdate": self.birthdate,
+                "national_id": self.national_id
+            }
+        return self._dict_cache
 
     @staticmethod
     def from_dict(data: dict) -> 'Player':
@@ -8,6 +8,10 @@ from utils.date_utils import (
 
 
 class Round:
+    __slots__ = (
+        'name', 'start_time', 'end_time', 'matches', 'is_finished',
+        '_unfinished_count'
+    )
 
     def __init__(self, name: str):
         if not name or not name.strip():
@@ -18,6 +22,7 @@ class Round:
         self.end_time: Optional[str] = None
         self.matches: List[Match] = []
         self.is_finished = False
+        self._unfinished_count = 0
 
     def add_match(self, match: Match):
         if self.is_finished:
@@ -27,18 +32,34 @@ class Round:
         if not isinstance(match, Match):
             raise TypeError("L'objet doit être une instance de Match")
         self.matches.append(match)
+        if not match.is_finished:
+            self._unfinished_count += 1
+
+    def set_match_result(self, match: Match, player1_score: float,
+                         player2_score: float):
+        was_finished = match.is_finished
+        match._set_result(player1_score, player2_score)
+        if not was_finished:
+            self._unfinished_count -= 1
+
+    @property
+    def unfinished_count(self) -> int:
+        return self._unfinished_count
+
+    @property
+    def finished_count(self) -> int:
+        return len(self.matches) - self._unfinished_count
 
     def end_round(self):
-        if not self.all_matches_finished():
-            unfinished_count = len(self.get_unfinished_matches())
+        if self._unfinished_count:
             raise ValueError(
-                f"Il reste {unfinished_count} match(s) non terminé(s)"
+                f"Il reste {self._unfinished_count} match(s) non terminé(s)"
             )
         self.end_time = get_current_timestamp()
         self.is_finished = True
 
     def all_matches_finished(self) -> bool:
-        return all(match.is_finished for match in self.matches)
+        return not self._unfinished_count
 
     def get_finished_matches(self) -> List[Match]:
         return [match for match in self.matches if match.is_finished]
@@ -49,8 +70,7 @@ class Round:
     def get_completion_percentage(self) -> float:
         if not self.matches:
             return 0.0
-        finished_count = len(self.get_finished_matches())
-        return (finished_count / len(self.matches)) * 100
+        return (self.finished_count / len(self.matches)) * 100
 
     def get_duration_minutes(self) -> Optional[int]:
         if not self.end_time:
@@ -80,6 +100,8 @@ class Round:
             try:
                 match = Match.from_dict(match_data)
                 round_obj.matches.append(match)
+                if not match.is_finished:
+                    round_obj._unfinished_count += 1
             except Exception as e:
                 print(f"Erreur lors du chargement d'un match: {e}")
 
@@ -1,5 +1,7 @@
 import re
-from typing import List, Tuple, Dict
+import sys
+import threading
+from typing import List, Tuple, Dict, Optional, Set, KeysView
 
 from .player import Player
 from .round import Round
@@ -10,20 +12,36 @@ from utils.tournament_helpers import (
     TournamentPairingHelper
 )
 
+_NAME_RE = re.compile(r"^[a-zA-ZÀ-ÿ0-9\s\-'\.]+$")
+_LOCATION_RE = re.compile(r"^[a-zA-ZÀ-ÿ0-9\s\-',\.]+$")
+# Tournaments are loaded on a background thread while new ones can be
+# created from the menu
+_ID_LOCK = threading.Lock()
+
 
 class Tournament:
+    __slots__ = (
+        'id', 'name', 'location', 'start_date', 'end_date', 'description',
+        'number_of_rounds', 'current_round', 'rounds', 'players',
+        'player_scores', '_players_by_id', '_opponents', '_is_finished',
+        '_rankings_cache', '_results_displayed'
+    )
 
     _id_counter = 1
 
     def __init__(self, name: str, location: str, start_date: str,
                  end_date: str, description: str = "",
-                 number_of_rounds: int = 4):
+                 number_of_rounds: int = 4,
+                 tournament_id: Optional[int] = None):
         self._validate_basic_data(
             name, location, start_date, end_date, number_of_rounds
         )
 
-        self.id = Tournament._id_counter
-        Tournament._id_counter += 1
+        if tournament_id is None:
+            with _ID_LOCK:
+                tournament_id = Tournament._id_counter
+                Tournament._id_counter += 1
+        self.id = tournament_id
 
         self.name = name.strip()
         self.location = location.strip()
@@ -35,9 +53,13 @@ class Tournament:
         self.current_round = 0
         self.rounds: List[Round] = []
         self.players: List[Player] = []
+        self._players_by_id: Dict[str, Player] = {}
+        self._opponents: Dict[str, Set[str]] = {}
         self._is_finished = False
 
         self.player_scores: Dict[str, float] = {}
+        self._rankings_cache: Optional[List[Tuple[Player, float]]] = None
+        self._results_displayed = False
 
     def _validate_basic_data(self, name: str, location: str, start_date: str,
                              end_date: str, number_of_rounds: int):
@@ -59,8 +81,7 @@ class Tournament:
         name = name.strip()
         if len(name) < 1 or len(name) > 100:
             return False
-        pattern = r"^[a-zA-ZÀ-ÿ0-9\s\-'\.]+$"
-        return bool(re.match(pattern, name))
+        return bool(_NAME_RE.match(name))
 
     def _validate_location(self, location: str) -> bool:
         if not location or not isinstance(location, str):
@@ -68,8 +89,7 @@ class Tournament:
         location = location.strip()
         if len(location) < 1 or len(location) > 200:
             return False
-        pattern = r"^[a-zA-ZÀ-ÿ0-9\s\-',\.]+$"
-        return bool(re.match(pattern, location))
+        return bool(_LOCATION_RE.match(location))
 
     def add_player(self, player: Player):
         if not isinstance(player, Player):
@@ -78,12 +98,14 @@ class Tournament:
             raise ValueError(
                 "Impossible d'ajouter un joueur à un tournoi commencé"
             )
-        if any(p.national_id == player.national_id for p in self.players):
+        if player.national_id in self._players_by_id:
             raise ValueError(
                 f"Le joueur {player.national_id} participe déjà au tournoi"
             )
         self.players.append(player)
+        self._players_by_id[player.national_id] = player
         self.player_scores[player.national_id] = 0.0
+        self._rankings_cache = None
 
     def remove_player(self, player: Player) -> bool:
         if self.has_started():
@@ -92,11 +114,32 @@ class Tournament:
             )
         try:
             self.players.remove(player)
+            self._players_by_id.pop(player.national_id, None)
             self.player_scores.pop(player.national_id, None)
+            self._rankings_cache = None
             return True
         except ValueError:
             return False
 
+    def reindex_players(self):
+        # Player ids can be edited from the player menu
+        self._players_by_id = {p.national_id: p for p in self.players}
+
+    @property
+    def player_ids(self) -> KeysView[str]:
+        return self._players_by_id.keys()
+
+    def get_player(self, national_id: str) -> Optional[Player]:
+        return self._players_by_id.get(national_id)
+
+    def have_played(self, national_id: str, other_id: str) -> bool:
+        return other_id in self._opponents.get(national_id, ())
+
+    def _record_opponents(self, match: Match):
+        p1, p2 = match.player1_national_id, match.player2_national_id
+        self._opponents.setdefault(p1, set()).add(p2)
+        self._opponents.setdefault(p2, set()).add(p1)
+
     def get_player_score(self, national_id: str) -> float:
         return self.player_scores.get(national_id, 0.0)
 
@@ -106,10 +149,25 @@ class Tournament:
         self.player_scores[national_id] = (
             self.player_scores.get(national_id, 0.0) + points
         )
+        self._rankings_cache = None
 
     def reset_all_scores(self):
         for nat_id in self.player_scores:
             self.player_scores[nat_id] = 0.0
+        self._rankings_cache = None
+
+    @property
+    def player_count(self) -> int:
+        return len(self.players)
+
+    @property
+    def is_startable(self) -> bool:
+        count = len(self.players)
+        return count >= 2 and count % 2 == 0
+
+    @property
+    def current_round_obj(self) -> Optional[Round]:
+        return self.rounds[-1] if self.rounds else None
 
     def has_started(self) -> bool:
         return bool(self.rounds)
@@ -126,9 +184,8 @@ class Tournament:
 
     def can_start_next_round(self) -> bool:
         return (
+            self.is_startable and
             not self.is_finished() and
-            len(self.players) >= 2 and
-            len(self.players) % 2 == 0 and
             self.current_round < self.number_of_rounds and
             (not self.rounds or self.rounds[-1].is_finished)
         )
@@ -139,32 +196,49 @@ class Tournament:
         self.current_round += 1
         new_round = Round(f"Tour {self.current_round}")
         for p1, p2 in pairs:
-            new_round.add_match(Match(p1.national_id, p2.national_id))
+            match = Match(p1.national_id, p2.national_id)
+            new_round.add_match(match)
+            self._record_opponents(match)
         self.rounds.append(new_round)
         return new_round
 
     def update_player_scores(self):
-        self.reset_all_scores()
+        # One pass over the finished matches, summed into a fresh dict
+        scores = dict.fromkeys(self.player_scores, 0.0)
         for rnd in self.rounds:
-            for m in rnd.get_finished_matches():
-                self.add_score_to_player(m.player1_national_id, m.player1_score)
-                self.add_score_to_player(m.player2_national_id, m.player2_score)
+            for m in rnd.matches:
+                if not m.is_finished:
+                    continue
+                p1, p2 = m.player1_national_id, m.player2_national_id
+                scores[p1] = scores.get(p1, 0.0) + m.player1_score
+                scores[p2] = scores.get(p2, 0.0) + m.player2_score
+        self.player_scores = scores
+        self._rankings_cache = None
 
     def get_current_rankings(self) -> List[Player]:
-        return sorted(
-            self.players,
-            key=lambda p: (
-                -self.get_player_score(p.national_id),
-                p.last_name,
-                p.first_name
+        return [p for p, _ in self.get_current_rankings_with_scores()]
+
+    def get_current_rankings_with_scores(self) -> List[Tuple[Player, float]]:
+        # Kept until a score or the player list changes
+        if self._rankings_cache is None:
+            score_of = self.player_scores.get
+            ranked = [(p, score_of(p.national_id, 0.0)) for p in self.players]
+            ranked.sort(
+                key=lambda ps: (-ps[1], ps[0].last_name, ps[0].first_name)
             )
-        )
+            self._rankings_cache = ranked
+        return list(self._rankings_cache)
+
+    def invalidate_rankings(self):
+        self._rankings_cache = None
 
     def get_final_rankings(self) -> List[Player]:
-        if not self.is_finished():
-            return self.get_current_rankings()
-        self.update_player_scores()
-        return self.get_current_rankings()
+        return [p for p, _ in self.get_final_rankings_with_scores()]
+
+    def get_final_rankings_with_scores(self) -> List[Tuple[Player, float]]:
+        if self.is_finished():
+            self.update_player_scores()
+        return self.get_current_rankings_with_scores()
 
     def generate_pairs_for_next_round(self) -> List[Tuple[Player, Player]]:
         return TournamentPairingHelper.generate_pairs_for_next_round(self)
@@ -184,10 +258,15 @@ class Tournament:
             "current_round": self.current_round,
             "rounds": [rnd.to_dict() for rnd in self.rounds],
             "players": [pl.to_dict() for pl in self.players],
-            "player_scores": self.player_scores,
+            "player_scores": dict(self.player_scores),
             "is_finished": self._is_finished
         }
 
+    @staticmethod
+    def reserve_ids(last_id: int):
+        with _ID_LOCK:
+            Tournament._id_counter = max(Tournament._id_counter, last_id + 1)
+
     @staticmethod
     def from_dict(data: dict, players_lookup: Dict[str, Player]) -> 'Tournament':
         required = ["name", "location", "start_date", "end_date"]
@@ -201,16 +280,17 @@ class Tournament:
             start_date=data["start_date"],
             end_date=data["end_date"],
             description=data.get("description", ""),
-            number_of_rounds=data.get("number_of_rounds", 4)
+            number_of_rounds=data.get("number_of_rounds", 4),
+            tournament_id=data.get("id")
         )
-        # restore ID and counter
-        t.id = data.get("id", t.id)
-        Tournament._id_counter = max(Tournament._id_counter, t.id + 1)
         t.current_round = data.get("current_round", 0)
         t._is_finished = data.get("is_finished", False)
 
         t._load_players(data.get("players", []), players_lookup)
-        t.player_scores = data.get("player_scores", {})
+        t.player_scores = {
+            sys.intern(pid): score
+            for pid, score in data.get("player_scores", {}).items()
+        }
         for pid in (p.national_id for p in t.players):
             t.player_scores.setdefault(pid, 0.0)
 
@@ -225,13 +305,18 @@ class Tournament:
             nid = pd.get("national_id")
             if nid in lookup:
                 self.players.append(lookup[nid])
+                self._players_by_id[nid] = lookup[nid]
 
     def _load_rounds(self, raw_rounds: List[dict]):
         for rd in raw_rounds:
             try:
-                self.rounds.append(Round.from_dict(rd))
+                round_obj = Round.from_dict(rd)
             except Exception as e:
                 print(f"Erreur lors du chargement d'un tour: {e}")
+                continue
+            self.rounds.append(round_obj)
+            for match in round_obj.matches:
+                self._record_opponents(match)
 
     def __str__(self) -> str:
         status = (
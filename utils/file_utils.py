@@ -1,9 +1,13 @@
 import os
 import json
-import shutil
 from typing import Any, Optional
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def ensure_directory_exists(directory_path: str) -> bool:
     try:
@@ -22,10 +26,14 @@ def safe_json_save(data: Any, file_path: str) -> bool:
 
         temp_file = f"{file_path}.tmp"
 
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            with open(temp_file, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
 
-        shutil.move(temp_file, file_path)
+        os.replace(temp_file, file_path)
         return True
 
     except Exception as e:
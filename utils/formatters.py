@@ -1,9 +1,12 @@
 from datetime import datetime
 from typing import Union
+from models.player import Player
 
 
 def format_player_name(player) -> str:
     try:
+        if isinstance(player, Player):
+            return player.get_full_name()
         if hasattr(player, 'first_name') and hasattr(player, 'last_name'):
             return f"{player.first_name} {player.last_name}"
         return str(player)
@@ -1,6 +1,6 @@
 import random
 from typing import List, Tuple, Dict
-from collections import defaultdict
+from collections import Counter
 from models.player import Player
 
 
@@ -31,10 +31,11 @@ class TournamentPairingHelper:
 
     @staticmethod
     def _generate_swiss_pairs(tournament) -> List[Tuple]:
+        score_of = tournament.player_scores.get
         sorted_players = sorted(
             tournament.players,
             key=lambda p: (
-                -tournament.get_player_score(p.national_id),
+                -score_of(p.national_id, 0.0),
                 p.last_name,
                 p.first_name
             )
@@ -65,14 +66,9 @@ class TournamentPairingHelper:
     @staticmethod
     def _have_played_against(tournament, player1: Player,
                              player2: Player) -> bool:
-        for round_obj in tournament.rounds:
-            for match in round_obj.matches:
-                if ((match.player1_national_id == player1.national_id and
-                     match.player2_national_id == player2.national_id) or
-                    (match.player1_national_id == player2.national_id and
-                     match.player2_national_id == player1.national_id)):
-                    return True
-        return False
+        return tournament.have_played(
+            player1.national_id, player2.national_id
+        )
 
 
 class TournamentValidationHelper:
@@ -117,6 +113,7 @@ class TournamentValidationHelper:
     @staticmethod
     def _validate_rounds(tournament) -> List[str]:
         errors = []
+        tournament_player_ids = tournament.player_ids
 
         for i, round_obj in enumerate(tournament.rounds):
             round_number = i + 1
@@ -125,23 +122,16 @@ class TournamentValidationHelper:
                 errors.append(f"Tour {round_number}: Aucun match")
                 continue
 
-            players_in_round = []
+            round_player_ids = set()
             for match in round_obj.matches:
-                players_in_round.extend([
-                    match.player1_national_id, match.player2_national_id
-                ])
-
-            seen_in_round = set()
-            for player_id in players_in_round:
-                if player_id in seen_in_round:
-                    errors.append(
-                        f"Tour {round_number}: Joueur {player_id} "
-                        "joue plusieurs fois"
-                    )
-                seen_in_round.add(player_id)
-
-            tournament_player_ids = {p.national_id for p in tournament.players}
-            round_player_ids = set(players_in_round)
+                for player_id in (match.player1_national_id,
+                                  match.player2_national_id):
+                    if player_id in round_player_ids:
+                        errors.append(
+                            f"Tour {round_number}: Joueur {player_id} "
+                            "joue plusieurs fois"
+                        )
+                    round_player_ids.add(player_id)
 
             missing_players = tournament_player_ids - round_player_ids
             if missing_players:
@@ -213,13 +203,13 @@ class TournamentStatisticsHelper:
 
     @staticmethod
     def _get_basic_info(tournament) -> Dict:
-        total_matches = sum(
-            len(round_obj.matches) for round_obj in tournament.rounds
-        )
-        finished_matches = sum(
-            len(round_obj.get_finished_matches())
-            for round_obj in tournament.rounds
-        )
+        total_matches = 0
+        finished_matches = 0
+        for round_obj in tournament.rounds:
+            for match in round_obj.matches:
+                total_matches += 1
+                if match.is_finished:
+                    finished_matches += 1
 
         completion_rate = 0
         if total_matches > 0:
@@ -304,32 +294,22 @@ class TournamentStatisticsHelper:
             tournament.get_player_score(p.national_id)
             for p in tournament.players
         ]
-        scores.sort(reverse=True)
-
-        total_score = sum(scores)
-        avg_score = total_score / len(scores)
-
-        max_score = max(scores) if scores else 0
-        leaders = [
-            p for p in tournament.players
-            if tournament.get_player_score(p.national_id) == max_score
-        ]
-
-        score_distribution = defaultdict(int)
-        for score in scores:
-            score_distribution[score] += 1
+        # Scores only take a handful of distinct values, min/max run on those
+        score_distribution = Counter(scores)
+        max_score = max(score_distribution)
+        min_score = min(score_distribution)
 
-        score_spread = 0
-        if scores:
-            score_spread = max_score - min(scores)
+        avg_score = sum(scores) / len(scores)
 
         return {
             'average_score': avg_score,
             'highest_score': max_score,
-            'lowest_score': min(scores) if scores else 0,
-            'leaders_count': len(leaders),
-            'score_spread': score_spread,
-            'score_distribution': dict(score_distribution)
+            'lowest_score': min_score,
+            'leaders_count': score_distribution[max_score],
+            'score_spread': max_score - min_score,
+            'score_distribution': dict(
+                sorted(score_distribution.items(), reverse=True)
+            )
         }
 
     @staticmethod
@@ -344,7 +324,7 @@ class TournamentStatisticsHelper:
                 'round_number': i + 1,
                 'round_name': round_obj.name,
                 'matches_count': len(round_obj.matches),
-                'finished_matches': len(round_obj.get_finished_matches()),
+                'finished_matches': round_obj.finished_count,
                 'completion_rate': round_obj.get_completion_percentage(),
                 'duration_minutes': round_obj.get_duration_minutes(),
                 'is_finished': round_obj.is_finished
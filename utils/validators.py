@@ -1,16 +1,22 @@
 import re
-from datetime import datetime, timedelta
-from typing import Tuple
+from datetime import date, datetime, timedelta
+from typing import Tuple, Optional
+
+_NAME_RE = re.compile(r"^[a-zA-ZÀ-ÿ\s\-']+$")
+_TOURNAMENT_NAME_RE = re.compile(r"^[a-zA-ZÀ-ÿ0-9\s\-'\.]+$")
+_LOCATION_RE = re.compile(r"^[a-zA-ZÀ-ÿ0-9\s\-',\.]+$")
 
 
 def validate_chess_id(chess_id: str) -> bool:
     if not chess_id or not isinstance(chess_id, str):
         return False
 
+    # Plain str checks for the AB12345 format, cheaper than the regex engine
     chess_id = chess_id.strip().upper()
-
-    pattern = r'^[A-Z]{2}\d{5}$'
-    return bool(re.match(pattern, chess_id))
+    letters, digits = chess_id[:2], chess_id[2:]
+    return (len(chess_id) == 7 and
+            letters.isascii() and letters.isalpha() and
+            digits.isascii() and digits.isdigit())
 
 
 def validate_name(name: str) -> bool:
@@ -22,19 +28,21 @@ def validate_name(name: str) -> bool:
     if len(name) < 2:
         return False
 
-    pattern = r"^[a-zA-ZÀ-ÿ\s\-']+$"
-    return bool(re.match(pattern, name))
+    return bool(_NAME_RE.match(name))
 
 
-def validate_date_format(date_str: str) -> bool:
+def _parse_date(date_str: str) -> Optional[date]:
     if not date_str or not isinstance(date_str, str):
-        return False
+        return None
 
     try:
-        datetime.strptime(date_str.strip(), '%Y-%m-%d')
-        return True
+        return datetime.strptime(date_str.strip(), '%Y-%m-%d').date()
     except ValueError:
-        return False
+        return None
+
+
+def validate_date_format(date_str: str) -> bool:
+    return _parse_date(date_str) is not None
 
 
 def validate_score(score: float) -> bool:
@@ -53,8 +61,7 @@ def validate_tournament_name(name: str) -> bool:
     if len(name) < 3 or len(name) > 100:
         return False
 
-    pattern = r"^[a-zA-ZÀ-ÿ0-9\s\-'\.]+$"
-    return bool(re.match(pattern, name))
+    return bool(_TOURNAMENT_NAME_RE.match(name))
 
 
 def validate_location(location: str) -> bool:
@@ -66,44 +73,35 @@ def validate_location(location: str) -> bool:
     if len(location) < 2 or len(location) > 200:
         return False
 
-    pattern = r"^[a-zA-ZÀ-ÿ0-9\s\-',\.]+$"
-    return bool(re.match(pattern, location))
+    return bool(_LOCATION_RE.match(location))
 
 
 def validate_date_range(start_date: str, end_date: str) -> bool:
-    if (not validate_date_format(start_date) or
-            not validate_date_format(end_date)):
-        return False
-
-    try:
-        start = datetime.strptime(start_date.strip(), '%Y-%m-%d')
-        end = datetime.strptime(end_date.strip(), '%Y-%m-%d')
-        return end >= start
-    except ValueError:
+    start = _parse_date(start_date)
+    end = _parse_date(end_date)
+    if start is None or end is None:
         return False
+    return end >= start
 
 
 def validate_tournament_dates(start_date: str,
                               end_date: str) -> Tuple[bool, str]:
-    if not validate_date_format(start_date):
+    # Each date is parsed once and the checks reuse the results
+    start = _parse_date(start_date)
+    if start is None:
         return False, "Format de date de début invalide (YYYY-MM-DD)"
 
-    if not validate_date_format(end_date):
+    end = _parse_date(end_date)
+    if end is None:
         return False, "Format de date de fin invalide (YYYY-MM-DD)"
 
-    if not validate_date_range(start_date, end_date):
+    if end < start:
         return (False, "La date de fin doit être postérieure ou égale "
                 "à la date de début")
 
-    try:
-        start = datetime.strptime(start_date.strip(), '%Y-%m-%d')
-        today = datetime.now()
-
-        if start < today - timedelta(days=365):
-            return (False, "La date de début ne peut pas être "
-                    "antérieure à 1 an")
-
-    except ValueError:
-        pass
+    if (datetime.combine(start, datetime.min.time()) <
+            datetime.now() - timedelta(days=365)):
+        return (False, "La date de début ne peut pas être "
+                "antérieure à 1 an")
 
     return True, ""
@@ -1,17 +1,35 @@
+import sys
 from typing import List
 
+try:
+    # Line editing and history for every input() prompt (absent on Windows)
+    import readline  # noqa: F401
+except ImportError:
+    pass
+
 
 class BaseView:
 
+    @staticmethod
+    def format_title(title: str) -> str:
+        return f"\n{'='*60}\n  {title.upper()}\n{'='*60}"
+
+    @staticmethod
+    def format_separator(char: str = "-", length: int = 60) -> str:
+        return char * length
+
+    @staticmethod
+    def write_lines(lines: List[str]):
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
     @staticmethod
     def display_title(title: str):
-        print(f"\n{'='*60}")
-        print(f"  {title.upper()}")
-        print(f"{'='*60}")
+        print(BaseView.format_title(title))
 
     @staticmethod
     def display_separator(char: str = "-", length: int = 60):
-        print(char * length)
+        print(BaseView.format_separator(char, length))
 
     @staticmethod
     def display_success(message: str):
@@ -4,24 +4,23 @@ from .base_view import BaseView
 class MenuView(BaseView):
 
     def display_main_menu(self):
-        self.display_title("CENTRE D'ÉCHECS - MENU PRINCIPAL")
-
-        print("Bienvenue dans le système de gestion de tournois d'échecs !")
-        print("Sélectionnez une option pour commencer :")
-        self.display_separator()
-
-        print("1. Gestion des joueurs")
-        print("   - Ajouter, modifier, supprimer des joueurs")
-        print("   - Consulter les profils et statistiques")
-        print()
-        print("2. Gestion des tournois")
-        print("   - Créer et organiser des tournois")
-        print("   - Gérer les tours et saisir les résultats")
-        print()
-        print("3. Rapports et statistiques")
-        print("   - Consulter les analyses de performance")
-        print("   - Générer des rapports détaillés")
-        print()
-        print("0. Quitter l'application")
-
-        self.display_separator()
+        self.write_lines([
+            self.format_title("CENTRE D'ÉCHECS - MENU PRINCIPAL"),
+            "Bienvenue dans le système de gestion de tournois d'échecs !",
+            "Sélectionnez une option pour commencer :",
+            self.format_separator(),
+            "1. Gestion des joueurs",
+            "   - Ajouter, modifier, supprimer des joueurs",
+            "   - Consulter les profils et statistiques",
+            "",
+            "2. Gestion des tournois",
+            "   - Créer et organiser des tournois",
+            "   - Gérer les tours et saisir les résultats",
+            "",
+            "3. Rapports et statistiques",
+            "   - Consulter les analyses de performance",
+            "   - Générer des rapports détaillés",
+            "",
+            "0. Quitter l'application",
+            self.format_separator(),
+        ])
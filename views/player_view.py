@@ -179,33 +179,43 @@ class PlayerView(BaseView):
         print(f"Total : {len(players)} joueur(s)")
 
     def display_player_details(self, player: Player):
-        self.display_title("DÉTAILS DU JOUEUR")
-
-        print(f"Nom complet           : {format_player_name(player)}")
-        print(f"Nom de famille        : {player.last_name}")
-        print(f"Prénom                : {player.first_name}")
-        print(f"Date de naissance     : {format_date_display(player.birthdate)}")
-        print(f"Identifiant national  : {player.national_id}")
+        lines = [
+            self.format_title("DÉTAILS DU JOUEUR"),
+            f"Nom complet           : {format_player_name(player)}",
+            f"Nom de famille        : {player.last_name}",
+            f"Prénom                : {player.first_name}",
+            f"Date de naissance     : {format_date_display(player.birthdate)}",
+            f"Identifiant national  : {player.national_id}",
+        ]
 
         age = None
         if hasattr(player, 'calculate_age'):
             age = player.calculate_age()
         if age is not None:
-            print(f"Âge                   : {age} ans")
+            lines.append(f"Âge                   : {age} ans")
         else:
-            print("Âge                   : Non calculable")
+            lines.append("Âge                   : Non calculable")
 
-        print("\nNote : Les scores sont affichés dans le contexte des tournois")
+        lines.append(
+            "\nNote : Les scores sont affichés dans le contexte des tournois"
+        )
 
         if hasattr(player, 'tournaments_played'):
-            print(f"Tournois joués        : {player.tournaments_played}")
+            lines.append(f"Tournois joués        : {player.tournaments_played}")
         if hasattr(player, 'total_matches'):
-            print(f"Matchs joués          : {player.total_matches}")
+            lines.append(f"Matchs joués          : {player.total_matches}")
         if hasattr(player, 'win_rate'):
-            print(f"Taux de victoire      : {player.win_rate:.1f}%")
+            lines.append(f"Taux de victoire      : {player.win_rate:.1f}%")
+
+        self.write_lines(lines)
 
     def select_player_from_list(self, players: List,
                                 title: str = "SÉLECTIONNER UN JOUEUR") -> Optional[Player]:
+        index = self.select_player_index_from_list(players, title)
+        return players[index] if index is not None else None
+
+    def select_player_index_from_list(self, players: List,
+                                      title: str = "SÉLECTIONNER UN JOUEUR") -> Optional[int]:
         if not players:
             self.display_info("Aucun joueur disponible.")
             return None
@@ -236,7 +246,7 @@ class PlayerView(BaseView):
                         f"Joueur sélectionné : "
                         f"{format_player_name(selected_player)}"
                     )
-                    return selected_player
+                    return choice - 1
                 else:
                     self.display_error(
                         f"Numéro invalide. Entrez un nombre entre 0 et "
@@ -128,6 +128,10 @@ class StatisticsView(BaseView):
         print(f"Nombre de tours : {len(tournament.rounds)}")
         self.display_separator()
 
+        names = {
+            player.national_id: format_player_name(player)
+            for player in tournament.players
+        }
         for i, round_obj in enumerate(tournament.rounds, 1):
             print(f"\n{round_obj.name} :")
             status_text = "Terminé" if round_obj.is_finished else "En cours"
@@ -137,11 +141,11 @@ class StatisticsView(BaseView):
             if round_obj.matches:
                 print("  Matchs :")
                 for j, match in enumerate(round_obj.matches, 1):
-                    player1_name = self._get_player_name_from_tournament(
-                        tournament, match.player1_national_id
+                    player1_name = names.get(
+                        match.player1_national_id, match.player1_national_id
                     )
-                    player2_name = self._get_player_name_from_tournament(
-                        tournament, match.player2_national_id
+                    player2_name = names.get(
+                        match.player2_national_id, match.player2_national_id
                     )
 
                     if match.is_finished:
@@ -186,10 +190,3 @@ class StatisticsView(BaseView):
         if total_players > 0:
             participation_rate = (active_players / total_players) * 100
             print(f"  Taux de participation  : {participation_rate:.1f}%")
-
-    def _get_player_name_from_tournament(self, tournament,
-                                         national_id: str) -> str:
-        for player in tournament.players:
-            if player.national_id == national_id:
-                return format_player_name(player)
-        return national_id
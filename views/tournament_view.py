@@ -1,4 +1,4 @@
-from typing import List, Dict, Optional, Union
+from typing import List, Dict, Optional
 from .base_view import BaseView
 from utils.formatters import (
     format_tournament_status, format_date_display, format_score_display,
@@ -8,6 +8,13 @@ from utils.formatters import (
 from utils.validators import validate_tournament_dates
 
 
+class SelectionChoice:
+    """Codes returned by the selection menus besides a list index (>= 0)."""
+    DONE = -1
+    CREATE = -2
+    BACK = -3
+
+
 class TournamentView(BaseView):
     def show_tournament_menu(self) -> str:
         """Displays the main tournament management menu and gets user choice."""
@@ -51,11 +58,10 @@ class TournamentView(BaseView):
               f"Tour: {tournament.current_round}/{tournament.number_of_rounds}")
 
         if tournament.has_started() and not tournament.is_finished():
-            current_round = (tournament.rounds[-1]
-                             if tournament.rounds else None)
+            current_round = tournament.current_round_obj
             if current_round:
                 total_matches = len(current_round.matches)
-                finished_matches = len(current_round.get_finished_matches())
+                finished_matches = current_round.finished_count
 
                 if current_round.is_finished:
                     print(f"Dernier tour: {current_round.name} - TERMINÉ")
@@ -174,7 +180,7 @@ class TournamentView(BaseView):
         }
 
     def show_player_selection_menu(self, available_players: List,
-                                   selected_players: List) -> Union[str, int]:
+                                   selected_players: List) -> int:
         self.display_title("SÉLECTION DES JOUEURS")
 
         if selected_players:
@@ -184,7 +190,7 @@ class TournamentView(BaseView):
 
         if not available_players:
             print("Aucun joueur disponible.")
-            return "done"
+            return SelectionChoice.DONE
 
         print(f"\nJoueurs disponibles ({len(available_players)}) :")
         for i, player in enumerate(available_players, 1):
@@ -198,11 +204,11 @@ class TournamentView(BaseView):
         try:
             choice = int(self.get_input("Votre choix"))
             if choice == 0:
-                return "done"
+                return SelectionChoice.DONE
             elif 1 <= choice <= len(available_players):
                 return choice - 1
             elif choice == create_index:
-                return "create"
+                return SelectionChoice.CREATE
             else:
                 self.show_error("Choix invalide.")
                 return self.show_player_selection_menu(
@@ -214,7 +220,8 @@ class TournamentView(BaseView):
                 available_players, selected_players
             )
 
-    def select_tournament(self, tournaments: List) -> Optional[Dict]:
+    def select_tournament(self, tournaments: List,
+                          default=None) -> Optional[Dict]:
         if not tournaments:
             return None
 
@@ -232,7 +239,13 @@ class TournamentView(BaseView):
         self.display_separator()
 
         try:
-            choice = int(self.get_input("Numéro du tournoi"))
+            if default in tournaments:
+                # Enter picks the previously selected tournament again
+                choice = int(self.get_input_with_default(
+                    "Numéro du tournoi", str(tournaments.index(default) + 1)
+                ))
+            else:
+                choice = int(self.get_input("Numéro du tournoi"))
             if choice == 0:
                 return None
             elif 1 <= choice <= len(tournaments):
@@ -242,10 +255,10 @@ class TournamentView(BaseView):
                     f"Numéro invalide. Entrez un nombre entre 0 et "
                     f"{len(tournaments)}."
                 )
-                return self.select_tournament(tournaments)
+                return self.select_tournament(tournaments, default)
         except ValueError:
             self.show_error("Veuillez entrer un numéro valide.")
-            return self.select_tournament(tournaments)
+            return self.select_tournament(tournaments, default)
 
     def show_tournament_details(self, tournament):
         self.display_title(f"DÉTAILS DU TOURNOI - {tournament.name}")
@@ -295,10 +308,9 @@ class TournamentView(BaseView):
         print(f"{'Pos':<4} {'Joueur':<25} {'Score':<6}")
         self.display_separator()
 
-        for i, player in enumerate(rankings, 1):
+        for i, (player, score) in enumerate(rankings, 1):
             position = f"{i}."
             name = format_player_name(player)
-            score = tournament.get_player_score(player.national_id)
             score_display = format_score_display(score)
 
             if len(name) > 25:
@@ -309,11 +321,11 @@ class TournamentView(BaseView):
         self.wait_for_user()
 
     def select_match_for_results(self, current_round, unfinished_matches,
-                                 tournament) -> Union[str, int]:
+                                 tournament) -> int:
         self.display_title(f"SAISIE DES RÉSULTATS - {current_round.name}")
 
         total_matches = len(current_round.matches)
-        finished_matches = len(current_round.get_finished_matches())
+        finished_matches = current_round.finished_count
         progression = (finished_matches / total_matches) * 100
 
         print(f"Progression: {finished_matches}/{total_matches} "
@@ -321,11 +333,10 @@ class TournamentView(BaseView):
         self.display_separator()
 
         print("Matchs en attente :")
+        names = self._player_names(tournament)
         for i, match in enumerate(unfinished_matches, 1):
-            p1_name = self._get_player_name_from_match(match, tournament)
-            p2_name = self._get_player_name_from_match(
-                match, tournament, player2=True
-            )
+            p1_name = self._get_player_name(names, match.player1_national_id)
+            p2_name = self._get_player_name(names, match.player2_national_id)
             print(f"{i}. {p1_name} vs {p2_name}")
 
         print("0. Retour")
@@ -334,7 +345,7 @@ class TournamentView(BaseView):
         try:
             choice = int(self.get_input("Sélectionner un match"))
             if choice == 0:
-                return "back"
+                return SelectionChoice.BACK
             elif 1 <= choice <= len(unfinished_matches):
                 return choice - 1
             else:
@@ -349,16 +360,8 @@ class TournamentView(BaseView):
             )
 
     def get_match_result_input(self, match,
-                               players_data=None) -> Optional[Dict]:
-        p1_name = match.player1_national_id
-        p2_name = match.player2_national_id
-
-        if players_data:
-            for player in players_data:
-                if player.national_id == match.player1_national_id:
-                    p1_name = format_player_name(player)
-                elif player.national_id == match.player2_national_id:
-                    p2_name = format_player_name(player)
+                               tournament=None) -> Optional[Dict]:
+        p1_name, p2_name = self._get_match_player_names(match, tournament)
 
         self.display_title("SAISIE DU RÉSULTAT")
         print(f"Match : {p1_name} vs {p2_name}")
@@ -383,21 +386,13 @@ class TournamentView(BaseView):
                 return {'player1_score': 0.0, 'player2_score': 1.0}
             else:
                 self.show_error("Choix invalide. Entrez 1, 2, 3 ou 0.")
-                return self.get_match_result_input(match, players_data)
+                return self.get_match_result_input(match, tournament)
         except ValueError:
             self.show_error("Veuillez entrer un nombre valide.")
-            return self.get_match_result_input(match, players_data)
-
-    def announce_match_result(self, match, players_data=None):
-        p1_name = match.player1_national_id
-        p2_name = match.player2_national_id
+            return self.get_match_result_input(match, tournament)
 
-        if players_data:
-            for player in players_data:
-                if player.national_id == match.player1_national_id:
-                    p1_name = format_player_name(player)
-                elif player.national_id == match.player2_national_id:
-                    p2_name = format_player_name(player)
+    def announce_match_result(self, match, tournament=None):
+        p1_name, p2_name = self._get_match_player_names(match, tournament)
 
         self.display_title("RÉSULTAT DU MATCH")
 
@@ -428,14 +423,13 @@ class TournamentView(BaseView):
         self.wait_for_user("Appuyez sur Entrée pour continuer...")
 
     def announce_tournament_end(self, tournament):
-        rankings = tournament.get_final_rankings()
+        rankings = tournament.get_final_rankings_with_scores()
 
         if not rankings:
             self.show_info("Aucun classement disponible.")
             return
 
-        winner = rankings[0]
-        winner_score = tournament.get_player_score(winner.national_id)
+        winner, winner_score = rankings[0]
 
         self.display_title("RÉSULTATS FINAUX DU TOURNOI")
 
@@ -460,12 +454,14 @@ class TournamentView(BaseView):
               f"{format_player_name(winner).upper()}")
         print(f"Score final : {format_score_display(winner_score)} points")
 
-        tied_winners = [
-            p for p in rankings
-            if tournament.get_player_score(p.national_id) == winner_score
-        ]
-        if len(tied_winners) > 1:
-            print(f"ÉGALITÉ : {len(tied_winners)} joueurs à égalité "
+        # Rankings are sorted by score, so the tie ends at the first lower one
+        tied_winners = 0
+        for _, score in rankings:
+            if score != winner_score:
+                break
+            tied_winners += 1
+        if tied_winners > 1:
+            print(f"ÉGALITÉ : {tied_winners} joueurs à égalité "
                   "au premier rang")
 
         self.display_separator()
@@ -477,10 +473,9 @@ class TournamentView(BaseView):
         print(header_format.format("Pos", "Joueur", "Score"))
         self.display_separator("-", 70)
 
-        for i, player in enumerate(rankings, 1):
+        for i, (player, score) in enumerate(rankings, 1):
             position = f"{i}."
             name = format_player_name(player)
-            score = tournament.get_player_score(player.national_id)
             score_display = format_score_display(score)
 
             if len(name) > 25:
@@ -510,7 +505,7 @@ class TournamentView(BaseView):
         print(f"Progression          : {completion}")
         print(f"Nombre de matchs     : {len(round_obj.matches)}")
         print(f"Matchs terminés      : "
-              f"{len(round_obj.get_finished_matches())}")
+              f"{round_obj.finished_count}")
 
         if round_obj.is_finished and round_obj.end_time:
             duration = format_duration(round_obj.start_time,
@@ -520,14 +515,15 @@ class TournamentView(BaseView):
             print("Note                 : Le tour peut être finalisé")
 
         print(f"\nMatchs du {round_obj.name} :")
+        names = self._player_names(tournament) if tournament else {}
         for i, match in enumerate(round_obj.matches, 1):
             if match.is_finished:
                 if tournament:
-                    p1_name = self._get_player_name_from_tournament(
-                        tournament, match.player1_national_id
+                    p1_name = self._get_player_name(
+                        names, match.player1_national_id
                     )
-                    p2_name = self._get_player_name_from_tournament(
-                        tournament, match.player2_national_id
+                    p2_name = self._get_player_name(
+                        names, match.player2_national_id
                     )
                     result = (f"{p1_name} {match.player1_score}-"
                               f"{match.player2_score} {p2_name}")
@@ -537,11 +533,11 @@ class TournamentView(BaseView):
                     print(f"  {i}. {result}")
             else:
                 if tournament:
-                    p1_name = self._get_player_name_from_tournament(
-                        tournament, match.player1_national_id
+                    p1_name = self._get_player_name(
+                        names, match.player1_national_id
                     )
-                    p2_name = self._get_player_name_from_tournament(
-                        tournament, match.player2_national_id
+                    p2_name = self._get_player_name(
+                        names, match.player2_national_id
                     )
                     print(f"  {i}. {p1_name} vs {p2_name} (En cours)")
                 else:
@@ -565,32 +561,33 @@ class TournamentView(BaseView):
 
         if tournament.rounds:
             print("\nHistorique des tours :")
+            names = self._player_names(tournament)
             for round_obj in tournament.rounds:
                 self.display_separator()
                 print(f"\n{round_obj.name} :")
                 status_text = "Terminé" if round_obj.is_finished else "En cours"
                 print(f"  Statut : {status_text}")
-                print(f"  Matchs : {len(round_obj.get_finished_matches())}/"
+                print(f"  Matchs : {round_obj.finished_count}/"
                       f"{len(round_obj.matches)}")
 
                 if round_obj.matches:
                     for j, match in enumerate(round_obj.matches, 1):
                         if match.is_finished:
-                            p1_name = self._get_player_name_from_tournament(
-                                tournament, match.player1_national_id
+                            p1_name = self._get_player_name(
+                                names, match.player1_national_id
                             )
-                            p2_name = self._get_player_name_from_tournament(
-                                tournament, match.player2_national_id
+                            p2_name = self._get_player_name(
+                                names, match.player2_national_id
                             )
                             result = (f"{p1_name} {match.player1_score}-"
                                       f"{match.player2_score} {p2_name}")
                             print(f"    {j}. {result}")
                         else:
-                            p1_name = self._get_player_name_from_tournament(
-                                tournament, match.player1_national_id
+                            p1_name = self._get_player_name(
+                                names, match.player1_national_id
                             )
-                            p2_name = self._get_player_name_from_tournament(
-                                tournament, match.player2_national_id
+                            p2_name = self._get_player_name(
+                                names, match.player2_national_id
                             )
                             print(f"    {j}. {p1_name} vs {p2_name} (En cours)")
         else:
@@ -606,11 +603,12 @@ class TournamentView(BaseView):
             return
 
         total = len(tournaments)
-        finished = len([t for t in tournaments if t.is_finished()])
-        in_progress = len([
-            t for t in tournaments
-            if t.has_started() and not t.is_finished()
-        ])
+        finished = in_progress = 0
+        for tournament in tournaments:
+            if tournament.is_finished():
+                finished += 1
+            elif tournament.has_started():
+                in_progress += 1
         not_started = total - finished - in_progress
 
         print(f"Total tournois : {total} | Terminés : {finished} | "
@@ -633,7 +631,7 @@ class TournamentView(BaseView):
         for i, round_obj in enumerate(tournament.rounds, 1):
             status_text = "Terminé" if round_obj.is_finished else "En cours"
             print(f"{round_obj.name} : {status_text}")
-            print(f"  Matchs : {len(round_obj.get_finished_matches())}/"
+            print(f"  Matchs : {round_obj.finished_count}/"
                   f"{len(round_obj.matches)}")
 
             if round_obj.is_finished and round_obj.get_duration_minutes():
@@ -651,6 +649,7 @@ class TournamentView(BaseView):
             self.show_info("Aucun match joué dans ce tournoi.")
             return
 
+        names = self._player_names(tournament)
         for round_obj in tournament.rounds:
             print(f"\n{round_obj.name} :")
             if not round_obj.matches:
@@ -659,21 +658,21 @@ class TournamentView(BaseView):
 
             for i, match in enumerate(round_obj.matches, 1):
                 if match.is_finished:
-                    p1_name = self._get_player_name_from_tournament(
-                        tournament, match.player1_national_id
+                    p1_name = self._get_player_name(
+                        names, match.player1_national_id
                     )
-                    p2_name = self._get_player_name_from_tournament(
-                        tournament, match.player2_national_id
+                    p2_name = self._get_player_name(
+                        names, match.player2_national_id
                     )
                     result = (f"{p1_name} {match.player1_score}-"
                               f"{match.player2_score} {p2_name}")
                     print(f"  {i}. {result}")
                 else:
-                    p1_name = self._get_player_name_from_tournament(
-                        tournament, match.player1_national_id
+                    p1_name = self._get_player_name(
+                        names, match.player1_national_id
                     )
-                    p2_name = self._get_player_name_from_tournament(
-                        tournament, match.player2_national_id
+                    p2_name = self._get_player_name(
+                        names, match.player2_national_id
                     )
                     print(f"  {i}. {p1_name} vs {p2_name} (En cours)")
 
@@ -717,20 +716,20 @@ class TournamentView(BaseView):
 
     def _show_contextual_hints(self, tournament):
         if not tournament.has_started():
-            if len(tournament.players) == 0:
+            player_count = tournament.player_count
+            if player_count == 0:
                 print("Conseil: Ajoutez d'abord des joueurs au tournoi")
-            elif len(tournament.players) < 2:
+            elif player_count < 2:
                 print("Conseil: Il faut au moins 2 joueurs pour commencer")
-            elif len(tournament.players) % 2 != 0:
+            elif not tournament.is_startable:
                 print("Conseil: Ajoutez un joueur pour avoir un nombre pair")
             else:
                 print("Prêt à commencer le tournoi!")
-                if len(tournament.players) < 4:
+                if player_count < 4:
                     print("Note: Avec moins de 4 joueurs, "
                           "des rematches seront nécessaires")
         elif tournament.has_started() and not tournament.is_finished():
-            current_round = (tournament.rounds[-1]
-                             if tournament.rounds else None)
+            current_round = tournament.current_round_obj
             if current_round:
                 if current_round.is_finished:
                     if tournament.current_round < tournament.number_of_rounds:
@@ -741,26 +740,31 @@ class TournamentView(BaseView):
                     print("Tous les matchs sont terminés - "
                           "Le tour peut être finalisé")
                 else:
-                    unfinished = len(current_round.get_unfinished_matches())
+                    unfinished = current_round.unfinished_count
                     print(f"Action requise: {unfinished} match(s) "
                           "en attente de résultats")
         elif tournament.is_finished():
             print("Tournoi terminé - Consultez les résultats finaux")
 
-    def _get_player_name_from_match(self, match, tournament, player2=False):
-        national_id = (match.player2_national_id if player2
-                       else match.player1_national_id)
-        return self._get_player_name_from_tournament(tournament, national_id)
-
-    def _get_player_name_from_tournament(self, tournament, national_id: str):
-        for player in tournament.players:
-            if player.national_id == national_id:
-                return format_player_name(player)
+    @staticmethod
+    def _get_match_player_names(match, tournament=None):
+        names = []
+        for national_id in (match.player1_national_id,
+                            match.player2_national_id):
+            player = tournament.get_player(national_id) if tournament else None
+            names.append(format_player_name(player) if player else national_id)
+        return names
+
+    @staticmethod
+    def _player_names(tournament) -> Dict[str, str]:
+        return {
+            player.national_id: format_player_name(player)
+            for player in tournament.players
+        }
 
-        try:
-            return f"Joueur {national_id}"
-        except Exception:
-            return national_id
+    @staticmethod
+    def _get_player_name(names: Dict[str, str], national_id: str) -> str:
+        return names.get(national_id) or f"Joueur {national_id}"
 
     def _get_player_name_from_id(self, national_id: str):
         return national_id